@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from "next/server";
 import { requireAuth } from "@/lib/auth-guard";
 
-const BRIGHTDATA_BASE_URL = "https://api.brightdata.com/datasets/v3";
+const BRIGHTDATA_BASE_URL = process.env.BRIGHTDATA_API_BASE_URL || "https://api.brightdata.com/datasets/v3";
 
 export async function POST(request: NextRequest) {
   const auth = await requireAuth();
@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from "next/server";
 import { requireAuth } from "@/lib/auth-guard";
 
+const BRIGHTDATA_BASE_URL = process.env.BRIGHTDATA_API_BASE_URL || "https://api.brightdata.com/datasets/v3";
+
 // BrightData Web Scraper API - Get snapshot data
 export async function POST(request: NextRequest) {
   const auth = await requireAuth();
@@ -27,7 +29,7 @@ export async function POST(request: NextRequest) {
     }
 
     // BrightData snapshot data endpoint
-    const brightDataUrl = `https://api.brightdata.com/datasets/v3/snapshot/${snapshotId}?format=json`;
+    const brightDataUrl = `${BRIGHTDATA_BASE_URL}/snapshot/${snapshotId}?format=json`;
 
     const response = await fetch(brightDataUrl, {
       method: "GET",
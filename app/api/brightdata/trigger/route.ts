@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from "next/server";
 import { requireAuth } from "@/lib/auth-guard";
 
+const BRIGHTDATA_BASE_URL = process.env.BRIGHTDATA_API_BASE_URL || "https://api.brightdata.com/datasets/v3";
+
 // BrightData Web Scraper API - Trigger a LinkedIn profile scrape
 export async function POST(request: NextRequest) {
   const auth = await requireAuth();
@@ -27,7 +29,7 @@ export async function POST(request: NextRequest) {
     }
 
     // BrightData Web Scraper API endpoint
-    const brightDataUrl = `https://api.brightdata.com/datasets/v3/trigger?dataset_id=gd_l1viktl72bvl7bjuj0&include_errors=true`;
+    const brightDataUrl = `${BRIGHTDATA_BASE_URL}/trigger?dataset_id=gd_l1viktl72bvl7bjuj0&include_errors=true`;
 
     console.log("[BrightData] Triggering scrape for:", url);
 
@@ -1,15 +1,17 @@
 import { NextRequest, NextResponse } from "next/server";
 
+const GITHUB_API_BASE_URL = process.env.GITHUB_API_BASE_URL || "https://api.github.com";
+
 export async function GET(request: NextRequest) {
   const username = request.nextUrl.searchParams.get("username");
   if (!username) return NextResponse.json({ error: "Missing username" }, { status: 400 });
   
   try {
     const [userRes, reposRes] = await Promise.all([
-      fetch(`https://api.github.com/users/${username}`, {
+      fetch(`${GITHUB_API_BASE_URL}/users/${username}`, {
         headers: process.env.GITHUB_TOKEN ? { Authorization: `token ${process.env.GITHUB_TOKEN}` } : {},
       }),
-      fetch(`https://api.github.com/users/${username}/repos?per_page=30&sort=pushed`, {
+      fetch(`${GITHUB_API_BASE_URL}/users/${username}/repos?per_page=30&sort=pushed`, {
         headers: process.env.GITHUB_TOKEN ? { Authorization: `token ${process.env.GITHUB_TOKEN}` } : {},
       }),
     ]);
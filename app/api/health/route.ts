@@ -19,5 +19,13 @@ export async function GET() {
   const allHealthy = checks.database;
   const statusCode = allHealthy ? 200 : 503;
 
-  return NextResponse.json(checks, { status: statusCode });
+  // Opt-in: scripts/api_tester.py --soak samples this to spot memory growth
+  // on a test box; never enable it on a public deployment
+  let memory = {};
+  if (process.env.HEALTH_EXPOSE_MEMORY === "true") {
+    const { rss, heapUsed } = process.memoryUsage();
+    memory = { memory: { rss, heapUsed } };
+  }
+
+  return NextResponse.json({ ...checks, ...memory }, { status: statusCode });
 }
@@ -9,25 +9,57 @@ Usage:
     python scripts/api_tester.py --env local
     python scripts/api_tester.py --env staging --report report.md
     python scripts/api_tester.py --env production --smoke-only
+    python scripts/api_tester.py --env local --stand-in --load --vus 20 --rps 100 --duration 30
+    python scripts/api_tester.py --env local --stand-in --stand-in-profile realistic
+    python scripts/api_tester.py --env local --stand-in --stand-in-profile fast --job-benchmark --jobs 20 --job-concurrency 1,4,16
+    python scripts/api_tester.py --env staging --connection-benchmark --pool-sizes 1,4,10
+    python scripts/api_tester.py --env production --cache-probe --cache-usernames octocat,torvalds
+    python scripts/api_tester.py --env staging --size-budget-kb 200 --encoding-probe --report report.md
+    python scripts/api_tester.py --env staging --iterations 10 --history perf.jsonl --compare-baseline
+    python scripts/api_tester.py --env local --soak 8h --soak-mix github-user=3,brightdata=1,health=1 --report soak.md
+    python scripts/api_tester.py --env production --record capture.jsonl
+    python scripts/api_tester.py --env staging --replay capture.jsonl --replay-speed 10 --report replay.md
+    python scripts/api_tester.py --env production --env staging --iterations 15 --report compare.md
+    python scripts/api_tester.py --env staging --json results.json --junit junit.xml --prometheus api.prom
+    python scripts/api_tester.py --env local --stand-in --stand-in-rate-limit 30 --load --vus 8 --duration 60
 
 Environment Variables:
     BRIGHTDATA_API_KEY: API key for BrightData (required for most tests)
     GITHUB_TOKEN: GitHub API token (optional, increases rate limits)
+    RECRUITOS_SESSION_TOKEN: NextAuth session token for routes behind requireAuth()
     RECRUITOS_API_URL: Custom API base URL (overrides --env)
 """
 
 import argparse
+import atexit
+import base64
+import ipaddress
 import json
+import math
 import os
+import queue
+import re
+import socket
+import statistics
+import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, field
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Optional
-from urllib.parse import urlencode
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+    from urllib3.util.connection import allowed_gai_family
 except ImportError:
     print("Error: 'requests' library not installed.")
     print("Install it with: pip install requests")
@@ -91,18 +123,357 @@ class TestSuite:
         return sum(r.duration_ms for r in self.results)
 
 
+# ============================================================
+# REQUEST TIMING
+# ============================================================
+
+@dataclass
+class RequestTiming:
+    """Per-phase breakdown of a single request, all in milliseconds.
+
+    ``ttfb_ms`` runs from the connection being ready to the response headers
+    arriving (request upload plus server processing); ``download_ms`` covers
+    reading the body. Reused pooled connections report zero setup phases.
+    ``throttle_ms`` is time spent waiting on rate limits before sending and is
+    not part of ``total_ms``.
+    """
+    dns_ms: float = 0.0
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    download_ms: float = 0.0
+    total_ms: float = 0.0
+    reused_connection: bool = True
+    throttle_ms: float = 0.0
+    throttle_retries: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+# The timing object for the request in flight on this thread; connections
+# record their setup phases into it while the request is being sent
+_active_timing = threading.local()
+
+
+class _PhaseTimingMixin:
+    """Splits urllib3 connection setup into DNS, TCP connect and TLS phases."""
+
+    _times_tls = False
+
+    def _new_conn(self):
+        timing = getattr(_active_timing, "current", None)
+        host = self._dns_host
+        start = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+            # Keep resolver order so fallback matches urllib3's own create_connection
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        except OSError:
+            # Let urllib3 re-resolve and raise its own NameResolutionError
+            addresses = [host]
+        resolved_at = time.perf_counter()
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (NewConnectionError, ConnectTimeoutError):
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+        if timing is not None:
+            timing.dns_ms = (resolved_at - start) * 1000
+            timing.connect_ms = (time.perf_counter() - resolved_at) * 1000
+        return sock
+
+    def connect(self):
+        timing = getattr(_active_timing, "current", None)
+        start = time.perf_counter()
+        super().connect()
+        if timing is not None:
+            timing.reused_connection = False
+            if self._times_tls:
+                handshake_ms = (time.perf_counter() - start) * 1000
+                timing.tls_ms = max(0.0, handshake_ms - timing.dns_ms - timing.connect_ms)
+
+
+class TimedHTTPConnection(_PhaseTimingMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_PhaseTimingMixin, HTTPSConnection):
+    _times_tls = True
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools open phase-timed connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+# ============================================================
+# RATE LIMITING
+# ============================================================
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """429, or GitHub's 403 with an exhausted X-RateLimit-Remaining."""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0"
+
+
+class UpstreamBucket:
+    """Token bucket for one upstream, kept in sync with its rate-limit headers.
+
+    Tokens are the upstream's X-RateLimit-Remaining less requests still in
+    flight, and refill to X-RateLimit-Limit at X-RateLimit-Reset. Requests go
+    out immediately while budget is plentiful; once it falls to ``low_water`` of
+    the limit the remaining tokens are spread evenly until the reset, and an
+    empty bucket waits for the reset. Retry-After blocks the bucket outright.
+    Until the upstream sends headers the bucket is unlimited.
+    """
+
+    def __init__(self, low_water: float = 0.1):
+        self.low_water = low_water
+        self.limit: Optional[int] = None
+        self.tokens: Optional[int] = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.next_slot = 0.0
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait_s: Optional[float] = None) -> float:
+        """Claim a token and return how many seconds to wait before sending.
+
+        A wait longer than ``max_wait_s`` is returned without claiming a token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.tokens is not None and now >= self.reset_at:
+                self.tokens = self.limit
+            start = max(now, self.blocked_until)
+            paced = False
+            if self.tokens is not None and self.tokens <= 0:
+                # Out of budget: wait for the window to roll over
+                start = max(start, self.reset_at)
+            elif self.tokens is not None and self.limit and self.tokens <= max(1, self.limit * self.low_water):
+                interval = max(0.0, self.reset_at - start) / self.tokens
+                start = max(start, self.next_slot)
+                paced = True
+            if max_wait_s is not None and start - now > max_wait_s:
+                return start - now
+            self.in_flight += 1
+            if self.tokens is None:
+                return start - now
+            if self.tokens <= 0:
+                self.tokens = self.limit or 1
+            elif paced:
+                self.next_slot = start + interval
+            self.tokens -= 1
+            return start - now
+
+    def observe(self, headers: Optional[Any]) -> None:
+        """Release the in-flight token and resync from a response's headers."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if headers is None:
+                return
+            now = time.monotonic()
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is None or reset is None:
+                return
+            try:
+                remaining_n, reset_epoch = int(remaining), float(reset)
+            except ValueError:
+                return
+            limit = headers.get("X-RateLimit-Limit")
+            self.limit = int(limit) if limit and limit.isdigit() else max(self.limit or 0, remaining_n)
+            self.reset_at = now + max(0.0, reset_epoch - time.time())
+            self.tokens = max(0, remaining_n - self.in_flight)
+
+
+@dataclass
+class ThrottleStats:
+    """Time spent waiting on one upstream's rate limit."""
+    waits: int = 0
+    wait_ms: float = 0.0
+    retries: int = 0
+    gave_up: int = 0
+
+
+class ThrottleTimeout(requests.RequestException):
+    """Raised instead of sleeping when a rate-limit wait is too long to sit out.
+
+    ``past_deadline`` is set when the wait would run past the caller's deadline
+    rather than past the scheduler's ``max_wait_s``.
+    """
+
+    def __init__(self, upstream: str, wait_s: float, past_deadline: bool = False):
+        reason = "past the run deadline" if past_deadline else "over the throttle wait cap"
+        super().__init__(f"{upstream} rate limit needs a {wait_s:.0f}s wait, {reason}")
+        self.upstream = upstream
+        self.wait_s = wait_s
+        self.past_deadline = past_deadline
+
+
+class RateLimitScheduler:
+    """Paces requests per upstream (APIClient ``api_type``) to avoid 429s.
+
+    Shared between clients so concurrent virtual users draw from one budget.
+    The app's routes do not forward upstream X-RateLimit-* headers (only the
+    stand-in's simulated upstreams send them), so against a real deployment a
+    bucket only learns from 429s, with the middleware's Retry-After. Waits longer than ``max_wait_s``, or running past the deadline passed to
+    ``acquire``, raise ThrottleTimeout instead of sleeping.
+    """
+
+    def __init__(self, enabled: bool = True, low_water: float = 0.1, max_wait_s: float = 60.0):
+        self.enabled = enabled
+        self.low_water = low_water
+        self.max_wait_s = max_wait_s
+        self.buckets: dict[str, UpstreamBucket] = {}
+        self.stats: dict[str, ThrottleStats] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, upstream: str) -> UpstreamBucket:
+        with self._lock:
+            if upstream not in self.buckets:
+                self.buckets[upstream] = UpstreamBucket(self.low_water)
+                self.stats[upstream] = ThrottleStats()
+            return self.buckets[upstream]
+
+    def acquire(self, upstream: str, deadline: Optional[float] = None) -> float:
+        """Wait for a token; returns the milliseconds spent waiting.
+
+        ``deadline`` is a ``time.perf_counter()`` value the wait must end before.
+        """
+        if not self.enabled:
+            return 0.0
+        max_wait_s = self.max_wait_s
+        if deadline is not None:
+            max_wait_s = min(max_wait_s, max(0.0, deadline - time.perf_counter()))
+        wait_s = self._bucket(upstream).reserve(max_wait_s)
+        if wait_s > max_wait_s:
+            with self._lock:
+                self.stats[upstream].gave_up += 1
+            raise ThrottleTimeout(upstream, wait_s, past_deadline=max_wait_s < self.max_wait_s)
+        if wait_s <= 0:
+            return 0.0
+        time.sleep(wait_s)
+        with self._lock:
+            stats = self.stats[upstream]
+            stats.waits += 1
+            stats.wait_ms += wait_s * 1000
+        return wait_s * 1000
+
+    def observe(self, upstream: str, response: Optional[requests.Response]) -> None:
+        if self.enabled:
+            self._bucket(upstream).observe(response.headers if response is not None else None)
+
+    def record_retry(self, upstream: str) -> None:
+        with self._lock:
+            self.stats[upstream].retries += 1
+
+
 # ============================================================
 # API CLIENT
 # ============================================================
 
+def session_cookie(token: str) -> str:
+    """Cookie header for a NextAuth session token, or a ``name=value`` cookie passed through as is.
+
+    The token is sent under both cookie names NextAuth uses, plain on http
+    deployments and ``__Secure-`` prefixed behind https.
+    """
+    if "=" in token:
+        return token
+    return f"next-auth.session-token={token}; __Secure-next-auth.session-token={token}"
+
+
 class APIClient:
-    """HTTP client for API testing."""
+    """HTTP client for API testing.
 
-    def __init__(self, base_url: str, brightdata_key: Optional[str] = None, github_token: Optional[str] = None):
+    Every response carries a ``timing`` attribute with its RequestTiming.
+    ``pool_size`` caps the keep-alive connections kept per host. Requests are
+    paced by ``scheduler`` per ``api_type``, with ``"app"`` for routes such as
+    /api/health that never call an upstream; rate-limited responses are retried
+    up to ``throttle_retries`` times once the scheduler allows; ``timing.total_ms``
+    covers only the final attempt, so latency excludes both the throttle waits
+    and the rejected attempts. A ``recorder`` captures every exchange for later
+    replay. ``session_token`` is sent as the NextAuth session cookie, which
+    the routes guarded by ``requireAuth()`` need. Setting ``deadline`` (a
+    ``time.perf_counter()`` value) makes throttle waits that would run past it
+    raise ThrottleTimeout.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        brightdata_key: Optional[str] = None,
+        github_token: Optional[str] = None,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+        scheduler: Optional[RateLimitScheduler] = None,
+        throttle_retries: int = 2,
+        recorder: Optional["TrafficRecorder"] = None,
+        session_token: Optional[str] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.brightdata_key = brightdata_key
         self.github_token = github_token
-        self.session = requests.Session()
+        self.session_token = session_token
+        if session is None:
+            session = requests.Session()
+            adapter = TimingAdapter(pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.scheduler = scheduler if scheduler is not None else RateLimitScheduler()
+        self.throttle_retries = throttle_retries
+        self.recorder = recorder
+        self.deadline: Optional[float] = None
+
+    def without_credentials(self) -> "APIClient":
+        """A client without API keys that shares this client's connection pool."""
+        return APIClient(
+            self.base_url,
+            session=self.session,
+            scheduler=self.scheduler,
+            throttle_retries=self.throttle_retries,
+            recorder=self.recorder,
+        )
 
     def _headers(self, api_type: str = "brightdata") -> dict:
         headers = {"Content-Type": "application/json"}
@@ -110,19 +481,242 @@ class APIClient:
             headers["X-BrightData-Key"] = self.brightdata_key
         if api_type == "github" and self.github_token:
             headers["X-GitHub-Token"] = self.github_token
+        if self.session_token:
+            headers["Cookie"] = session_cookie(self.session_token)
         return headers
 
+    def _request(self, method: str, url: str, api_type: str, **kwargs: Any) -> requests.Response:
+        throttle_ms = 0.0
+        rejected_ms = 0.0
+        retries = 0
+        while True:
+            try:
+                throttle_ms += self.scheduler.acquire(api_type, self.deadline)
+            except ThrottleTimeout as e:
+                e.excluded_ms = throttle_ms + rejected_ms
+                raise
+            try:
+                response = self._send(method, url, **kwargs)
+            except requests.RequestException as e:
+                self.scheduler.observe(api_type, None)
+                # Lets callers timing a failed request leave out the rate-limit time
+                e.excluded_ms = throttle_ms + rejected_ms
+                raise
+            self.scheduler.observe(api_type, response)
+            if not is_rate_limited(response) or retries >= self.throttle_retries:
+                break
+            retries += 1
+            rejected_ms += response.timing.total_ms
+            self.scheduler.record_retry(api_type)
+        response.timing.throttle_ms = throttle_ms
+        response.timing.throttle_retries = retries
+        if self.recorder:
+            self.recorder.record(self.base_url, method, url, kwargs, response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        timing = RequestTiming()
+        _active_timing.current = timing
+        start = time.perf_counter()
+        try:
+            # Stream so the call returns once headers arrive, then time the body read
+            response = self.session.request(method, url, stream=True, timeout=60, **kwargs)
+            headers_at = time.perf_counter()
+            response.content
+        finally:
+            _active_timing.current = None
+        done = time.perf_counter()
+        setup_ms = timing.dns_ms + timing.connect_ms + timing.tls_ms
+        timing.ttfb_ms = max(0.0, (headers_at - start) * 1000 - setup_ms)
+        timing.download_ms = (done - headers_at) * 1000
+        timing.total_ms = (done - start) * 1000
+        response.timing = timing
+        return response
+
     def get(self, path: str, params: Optional[dict] = None, api_type: str = "brightdata") -> requests.Response:
         url = f"{self.base_url}{path}"
         if params:
             url = f"{url}?{urlencode(params)}"
-        return self.session.get(url, headers=self._headers(api_type), timeout=60)
+        return self._request("GET", url, api_type, headers=self._headers(api_type))
 
     def post(self, path: str, params: Optional[dict] = None, body: Optional[dict] = None, api_type: str = "brightdata") -> requests.Response:
         url = f"{self.base_url}{path}"
         if params:
             url = f"{url}?{urlencode(params)}"
-        return self.session.post(url, headers=self._headers(api_type), json=body, timeout=60)
+        return self._request("POST", url, api_type, headers=self._headers(api_type), json=body)
+
+
+def elapsed_ms(start: float, error: Optional[BaseException] = None) -> float:
+    """Wall time since ``start`` for a request that raised, minus any rate-limit time it spent."""
+    return (time.perf_counter() - start) * 1000 - getattr(error, "excluded_ms", 0.0)
+
+
+# ============================================================
+# PAYLOAD PROFILING
+# ============================================================
+
+@dataclass
+class PayloadStats:
+    """Transfer and decode cost of one response body."""
+    wire_bytes: int
+    body_bytes: int
+    content_encoding: str
+    json_decode_ms: Optional[float] = None
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.body_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "compression_ratio": self.compression_ratio}
+
+
+def profile_payload(response: requests.Response) -> PayloadStats:
+    """Measure wire size, decoded size and JSON decode time of a consumed response."""
+    body = response.content
+    # urllib3 counts bytes pulled off the socket, i.e. before decompression
+    wire_bytes = response.raw.tell() if response.raw is not None else 0
+    if not wire_bytes:
+        wire_bytes = int(response.headers.get("Content-Length") or len(body))
+    stats = PayloadStats(
+        wire_bytes=wire_bytes,
+        body_bytes=len(body),
+        content_encoding=response.headers.get("Content-Encoding", "identity"),
+    )
+    if "json" in response.headers.get("Content-Type", ""):
+        start = time.perf_counter()
+        try:
+            json.loads(body)
+            stats.json_decode_ms = (time.perf_counter() - start) * 1000
+        except ValueError:
+            pass
+    return stats
+
+
+def response_details(response: requests.Response) -> dict:
+    """Timing, payload and server-phase details recorded on every TestResult with a response."""
+    return {
+        "timing": response.timing.as_dict(),
+        "payload": profile_payload(response).as_dict(),
+        "server_timing": server_timing(response),
+    }
+
+
+@dataclass
+class EncodingNegotiation:
+    """What an endpoint served for one Accept-Encoding request header."""
+    endpoint: str
+    requested: str
+    served: str
+    wire_bytes: int
+
+
+def probe_encodings(client: APIClient, scenarios: list[str], encodings: tuple[str, ...] = ("identity", "gzip", "br")) -> list[EncodingNegotiation]:
+    """Request each endpoint with each Accept-Encoding and record the raw bytes served.
+
+    Bodies are read undecoded, so brotli responses are measured even when no
+    brotli decoder is installed.
+    """
+    results = []
+    for name in scenarios:
+        scenario = LOAD_SCENARIOS[name]
+        url = f"{client.base_url}{scenario.path}"
+        if scenario.params:
+            url = f"{url}?{urlencode(scenario.params)}"
+        for encoding in encodings:
+            headers = {**client._headers(scenario.api_type), "Accept-Encoding": encoding}
+            try:
+                response = client.session.request(
+                    scenario.method, url, headers=headers, json=scenario.body, stream=True, timeout=60,
+                )
+                raw = response.raw.read(decode_content=False)
+                response.close()
+            except requests.RequestException:
+                continue
+            results.append(EncodingNegotiation(
+                endpoint=name,
+                requested=encoding,
+                served=response.headers.get("Content-Encoding", "identity"),
+                wire_bytes=len(raw),
+            ))
+    return results
+
+
+# ============================================================
+# SERVER TIMING
+# ============================================================
+
+# Phase under which the server's own end-to-end time is reported
+SERVER_TOTAL = "total"
+# Client-measured latency not accounted for by the server: network, TLS, queueing
+OUTSIDE_SERVER = "outside server"
+
+
+def _split_unquoted(text: str, separator: str) -> list[str]:
+    """Split on ``separator`` outside double-quoted strings."""
+    parts, current, quoted = [], "", False
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        if char == separator and not quoted:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    """Durations in ms per metric from a W3C Server-Timing header.
+
+    ``db;dur=53, app;dur=47.2, cache;desc="hit"`` gives
+    ``{"db": 53.0, "app": 47.2}``; metrics without ``dur`` are skipped and
+    repeated names are summed.
+    """
+    phases: dict[str, float] = {}
+    for metric in _split_unquoted(header, ","):
+        name, *params = _split_unquoted(metric, ";")
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "dur":
+                try:
+                    phases[name] = phases.get(name, 0.0) + float(value.strip().strip('"'))
+                except ValueError:
+                    pass
+    return phases
+
+
+def parse_response_time(value: str) -> Optional[float]:
+    """Milliseconds from an X-Response-Time value such as ``12.3ms``, ``0.8s`` or ``12``."""
+    value = value.strip().lower()
+    for suffix, scale in (("ms", 1.0), ("us", 0.001), ("µs", 0.001), ("s", 1000.0)):
+        if value.endswith(suffix):
+            value, unit = value[: -len(suffix)], scale
+            break
+    else:
+        unit = 1.0
+    try:
+        return float(value) * unit
+    except ValueError:
+        return None
+
+
+def server_timing(response: requests.Response) -> dict[str, float]:
+    """Named server phases of a response, with the server's own total when it reports one."""
+    phases = parse_server_timing(response.headers.get("Server-Timing", ""))
+    if SERVER_TOTAL not in phases:
+        total = parse_response_time(response.headers.get("X-Response-Time", ""))
+        if total is not None:
+            phases[SERVER_TOTAL] = total
+    return phases
+
+
+def server_total_ms(phases: dict[str, float]) -> float:
+    """Time spent in the server: its reported total, else the sum of its phases."""
+    if SERVER_TOTAL in phases:
+        return phases[SERVER_TOTAL]
+    return sum(phases.values())
 
 
 # ============================================================
@@ -131,11 +725,11 @@ class APIClient:
 
 def test_health_check(client: APIClient) -> TestResult:
     """Test that API is reachable."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         # Try to hit the API with an invalid action to verify it's responding
         response = client.get("/api/brightdata", {"action": "health"})
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         # We expect a 400 error for invalid action, which means API is working
         if response.status_code == 400:
@@ -145,6 +739,7 @@ def test_health_check(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview="API responding correctly (400 for invalid action)",
+                details=response_details(response),
             )
         elif response.status_code == 200:
             return TestResult(
@@ -152,6 +747,7 @@ def test_health_check(client: APIClient) -> TestResult:
                 passed=True,
                 duration_ms=duration,
                 status_code=response.status_code,
+                details=response_details(response),
             )
         else:
             return TestResult(
@@ -160,23 +756,24 @@ def test_health_check(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 error=f"Unexpected status: {response.status_code}",
+                details=response_details(response),
             )
     except requests.RequestException as e:
         return TestResult(
             name="Health Check",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_brightdata_trigger_validation(client: APIClient) -> TestResult:
     """Test that trigger action validates input correctly."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         # Missing URL should fail validation
         response = client.post("/api/brightdata", {"action": "trigger"})
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 400:
             data = response.json()
@@ -187,6 +784,7 @@ def test_brightdata_trigger_validation(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview=json.dumps(data)[:200],
+                details=response_details(response),
             )
         return TestResult(
             name="Trigger Validation (missing URL)",
@@ -194,22 +792,23 @@ def test_brightdata_trigger_validation(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error="Expected 400, got different status",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="Trigger Validation (missing URL)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_brightdata_trigger_invalid_url(client: APIClient) -> TestResult:
     """Test that trigger action rejects non-LinkedIn URLs."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = client.post("/api/brightdata", {"action": "trigger", "url": "https://google.com"})
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 400:
             return TestResult(
@@ -218,6 +817,7 @@ def test_brightdata_trigger_invalid_url(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview="Correctly rejected non-LinkedIn URL",
+                details=response_details(response),
             )
         return TestResult(
             name="Trigger Validation (invalid URL)",
@@ -225,24 +825,25 @@ def test_brightdata_trigger_invalid_url(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error="Should reject non-LinkedIn URLs",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="Trigger Validation (invalid URL)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_brightdata_auth_required(client: APIClient) -> TestResult:
     """Test that trigger requires API key."""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        # Create a client without API key
-        no_auth_client = APIClient(client.base_url)
+        # Drop the API key but keep the pooled connection
+        no_auth_client = client.without_credentials()
         response = no_auth_client.post("/api/brightdata", {"action": "trigger", "url": TEST_LINKEDIN_URL})
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 401:
             return TestResult(
@@ -251,6 +852,7 @@ def test_brightdata_auth_required(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview="Correctly returns 401 without API key",
+                details=response_details(response),
             )
         return TestResult(
             name="Auth Required (trigger)",
@@ -258,26 +860,27 @@ def test_brightdata_auth_required(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error=f"Expected 401, got {response.status_code}",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="Auth Required (trigger)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_scrape_tier1(client: APIClient) -> TestResult:
     """Test Tier 1 scraping (direct fetch)."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = client.post(
             "/api/brightdata",
             {"action": "scrape"},
             {"url": "https://example.com", "tier": "1"}
         )
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 200:
             data = response.json()
@@ -288,6 +891,7 @@ def test_scrape_tier1(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview=f"Content length: {len(data.get('content', data.get('data', {}).get('content', '')))} chars",
+                details=response_details(response),
             )
         return TestResult(
             name="Scrape Tier 1 (example.com)",
@@ -295,26 +899,27 @@ def test_scrape_tier1(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error=f"Expected 200, got {response.status_code}",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="Scrape Tier 1 (example.com)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_github_user(client: APIClient) -> TestResult:
     """Test GitHub user endpoint."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = client.get(
             "/api/github",
             {"action": "user", "username": TEST_GITHUB_USERNAME},
             api_type="github"
         )
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 200:
             data = response.json()
@@ -327,6 +932,7 @@ def test_github_user(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview=f"User: {user_data.get('login', user_data.get('name', 'unknown'))}",
+                details=response_details(response),
             )
         return TestResult(
             name="GitHub User (octocat)",
@@ -334,26 +940,27 @@ def test_github_user(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error=f"Expected 200, got {response.status_code}",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="GitHub User (octocat)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_github_repos(client: APIClient) -> TestResult:
     """Test GitHub repos endpoint."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = client.get(
             "/api/github",
             {"action": "repos", "username": TEST_GITHUB_USERNAME},
             api_type="github"
         )
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 200:
             data = response.json()
@@ -365,6 +972,7 @@ def test_github_repos(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview=f"Repos: {repo_data.get('total', len(repo_data.get('repos', [])))}",
+                details=response_details(response),
             )
         return TestResult(
             name="GitHub Repos (octocat)",
@@ -372,26 +980,27 @@ def test_github_repos(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error=f"Expected 200, got {response.status_code}",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="GitHub Repos (octocat)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_github_full(client: APIClient) -> TestResult:
     """Test GitHub full profile endpoint."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = client.get(
             "/api/github",
             {"action": "full", "username": TEST_GITHUB_USERNAME},
             api_type="github"
         )
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 200:
             data = response.json()
@@ -409,6 +1018,7 @@ def test_github_full(client: APIClient) -> TestResult:
                     "hasUser": has_user,
                     "hasRepos": has_repos,
                     "hasLanguages": has_languages,
+                    **response_details(response),
                 },
             )
         return TestResult(
@@ -417,22 +1027,23 @@ def test_github_full(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error=f"Expected 200, got {response.status_code}",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="GitHub Full Profile (octocat)",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
 
 def test_invalid_action(client: APIClient) -> TestResult:
     """Test that invalid actions are rejected."""
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = client.get("/api/brightdata", {"action": "invalid_action"})
-        duration = (time.time() - start) * 1000
+        duration = response.timing.total_ms
 
         if response.status_code == 400:
             data = response.json()
@@ -443,6 +1054,7 @@ def test_invalid_action(client: APIClient) -> TestResult:
                 duration_ms=duration,
                 status_code=response.status_code,
                 response_preview=data.get("error", "")[:100],
+                details=response_details(response),
             )
         return TestResult(
             name="Invalid Action Rejection",
@@ -450,12 +1062,13 @@ def test_invalid_action(client: APIClient) -> TestResult:
             duration_ms=duration,
             status_code=response.status_code,
             error="Expected 400 for invalid action",
+            details=response_details(response),
         )
     except Exception as e:
         return TestResult(
             name="Invalid Action Rejection",
             passed=False,
-            duration_ms=(time.time() - start) * 1000,
+            duration_ms=elapsed_ms(start, e),
             error=str(e),
         )
 
@@ -464,23 +1077,78 @@ def test_invalid_action(client: APIClient) -> TestResult:
 # TEST RUNNER
 # ============================================================
 
-def run_smoke_tests(client: APIClient) -> TestSuite:
+def run_test(
+    test_fn: Callable[[APIClient], TestResult],
+    client: APIClient,
+    iterations: int = 1,
+    before_each: Optional[Callable[[], None]] = None,
+) -> TestResult:
+    """Run a test one or more times, keeping every duration as a latency sample.
+
+    ``before_each`` is called ahead of every iteration, e.g. to hold several
+    targets in lockstep.
+
+    The returned result is the first failure, or the last run if all passed;
+    ``details["samples_ms"]`` holds the durations of the passing runs,
+    ``details["server_timing"]`` their median server phases and
+    ``details["status_counts"]`` the status code of every run, failed or not.
+    """
+    samples = []
+    server_samples: dict[str, list[float]] = {}
+    status_counts: dict[str, int] = {}
+    result = None
+    for _ in range(max(1, iterations)):
+        if before_each:
+            before_each()
+        result = test_fn(client)
+        status = str(result.status_code) if result.status_code is not None else "none"
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if not result.passed:
+            break
+        samples.append(result.duration_ms)
+        for phase, ms in result.details.get("server_timing", {}).items():
+            server_samples.setdefault(phase, []).append(ms)
+    result.details["samples_ms"] = samples
+    result.details["status_counts"] = status_counts
+    if result.passed and server_samples:
+        result.details["server_timing"] = {phase: statistics.median(v) for phase, v in server_samples.items()}
+    return result
+
+
+SMOKE_TESTS = [
+    test_health_check,
+    test_invalid_action,
+    test_scrape_tier1,
+    test_github_user,
+]
+
+FULL_TESTS = [
+    # Health & basic
+    test_health_check,
+    test_invalid_action,
+    # BrightData validation
+    test_brightdata_trigger_validation,
+    test_brightdata_trigger_invalid_url,
+    test_brightdata_auth_required,
+    # Scraping
+    test_scrape_tier1,
+    # GitHub
+    test_github_user,
+    test_github_repos,
+    test_github_full,
+]
+
+
+def run_smoke_tests(client: APIClient, iterations: int = 1) -> TestSuite:
     """Run quick smoke tests to verify API is working."""
     suite = TestSuite(name="Smoke Tests")
     suite.started_at = datetime.now()
 
     print("\n🔥 Running Smoke Tests...\n")
 
-    tests = [
-        test_health_check,
-        test_invalid_action,
-        test_scrape_tier1,
-        test_github_user,
-    ]
-
-    for test_fn in tests:
+    for test_fn in SMOKE_TESTS:
         print(f"  Testing: {test_fn.__doc__}...", end=" ")
-        result = test_fn(client)
+        result = run_test(test_fn, client, iterations)
         suite.results.append(result)
         print("✅" if result.passed else f"❌ {result.error}")
 
@@ -488,32 +1156,16 @@ def run_smoke_tests(client: APIClient) -> TestSuite:
     return suite
 
 
-def run_full_tests(client: APIClient) -> TestSuite:
+def run_full_tests(client: APIClient, iterations: int = 1) -> TestSuite:
     """Run comprehensive API tests."""
     suite = TestSuite(name="Full API Tests")
     suite.started_at = datetime.now()
 
     print("\n🧪 Running Full API Tests...\n")
 
-    tests = [
-        # Health & basic
-        test_health_check,
-        test_invalid_action,
-        # BrightData validation
-        test_brightdata_trigger_validation,
-        test_brightdata_trigger_invalid_url,
-        test_brightdata_auth_required,
-        # Scraping
-        test_scrape_tier1,
-        # GitHub
-        test_github_user,
-        test_github_repos,
-        test_github_full,
-    ]
-
-    for test_fn in tests:
+    for test_fn in FULL_TESTS:
         print(f"  {test_fn.__name__}...", end=" ")
-        result = test_fn(client)
+        result = run_test(test_fn, client, iterations)
         suite.results.append(result)
         status = "✅" if result.passed else "❌"
         print(f"{status} ({result.duration_ms:.0f}ms)")
@@ -525,145 +1177,3259 @@ def run_full_tests(client: APIClient) -> TestSuite:
 
 
 # ============================================================
-# REPORTING
+# LOAD TESTING
 # ============================================================
 
-def generate_report(suite: TestSuite, env: str) -> str:
-    """Generate a markdown test report."""
-    report = f"""# API Test Report
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram.
 
-**Environment:** {env}
-**Date:** {suite.started_at.isoformat() if suite.started_at else 'N/A'}
-**Duration:** {suite.duration_ms:.0f}ms
+    Values are stored in microseconds. Each power-of-two range is split into
+    2**significant_bits sub-buckets, so any recorded value is reproduced within
+    1 / 2**(significant_bits - 1) relative error (under 2% at the default).
+    """
 
-## Summary
+    def __init__(self, significant_bits: int = 7):
+        self.significant_bits = significant_bits
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
 
-| Metric | Value |
-|--------|-------|
-| Total Tests | {suite.total} |
-| Passed | {suite.passed} ✅ |
-| Failed | {suite.failed} ❌ |
-| Pass Rate | {(suite.passed / suite.total * 100):.1f}% |
+    def _index(self, value_us: int) -> int:
+        shift = max(0, value_us.bit_length() - self.significant_bits)
+        return (shift << self.significant_bits) | (value_us >> shift)
 
-## Results
+    def _value_at(self, index: int) -> int:
+        shift = index >> self.significant_bits
+        mantissa = index & ((1 << self.significant_bits) - 1)
+        # Midpoint of the bucket's range
+        return (mantissa << shift) + ((1 << shift) >> 1)
 
-| Test | Status | Duration | Notes |
-|------|--------|----------|-------|
-"""
+    def record(self, value_ms: float) -> None:
+        value_us = max(0, int(round(value_ms * 1000)))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
 
-    for result in suite.results:
-        status = "✅ Pass" if result.passed else "❌ Fail"
-        notes = result.error or result.response_preview or "-"
-        report += f"| {result.name} | {status} | {result.duration_ms:.0f}ms | {notes[:50]} |\n"
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        if other.max_us is not None:
+            self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
 
-    if suite.failed > 0:
-        report += "\n## Failed Tests Details\n\n"
-        for result in suite.results:
-            if not result.passed:
-                report += f"""### {result.name}
+    def percentile(self, p: float) -> float:
+        """Latency in ms at percentile p (0-100)."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                value_us = min(max(self._value_at(index), self.min_us), self.max_us)
+                return value_us / 1000
+        return self.max_us / 1000
 
-- **Status Code:** {result.status_code or 'N/A'}
-- **Error:** {result.error or 'Unknown'}
-- **Response:** {result.response_preview or 'N/A'}
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1000 if self.count else 0.0
 
-"""
+    @property
+    def min(self) -> float:
+        return (self.min_us or 0) / 1000
 
-    return report
+    @property
+    def max(self) -> float:
+        return (self.max_us or 0) / 1000
 
 
-def print_summary(suite: TestSuite) -> None:
-    """Print test summary to console."""
-    print("\n" + "=" * 50)
-    print(f"📊 Test Results: {suite.name}")
-    print("=" * 50)
-    print(f"  Total:  {suite.total}")
-    print(f"  Passed: {suite.passed} ✅")
-    print(f"  Failed: {suite.failed} ❌")
-    print(f"  Rate:   {(suite.passed / suite.total * 100):.1f}%")
-    print(f"  Time:   {suite.duration_ms:.0f}ms")
-    print("=" * 50)
+@dataclass
+class LoadScenario:
+    """A single request shape issued by load-test virtual users."""
+    name: str
+    method: str
+    path: str
+    params: dict
+    api_type: str = "brightdata"
+    body: Optional[dict] = None
+    expected_status: tuple[int, ...] = (200,)
 
+    def send(self, client: "APIClient") -> requests.Response:
+        if self.method == "POST":
+            return client.post(self.path, self.params, self.body, api_type=self.api_type)
+        return client.get(self.path, self.params, api_type=self.api_type)
 
-# ============================================================
-# MAIN
-# ============================================================
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="RecruitOS API Tester",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__,
-    )
-    parser.add_argument(
-        "--env",
-        choices=["local", "staging", "production"],
-        default="local",
-        help="Environment to test against (default: local)",
-    )
-    parser.add_argument(
-        "--url",
-        help="Custom API base URL (overrides --env)",
-    )
-    parser.add_argument(
-        "--smoke-only",
-        action="store_true",
-        help="Run only smoke tests (quick verification)",
-    )
-    parser.add_argument(
-        "--report",
-        help="Output file for markdown report",
-    )
-    parser.add_argument(
-        "--brightdata-key",
-        help="BrightData API key (or set BRIGHTDATA_API_KEY env var)",
-    )
-    parser.add_argument(
-        "--github-token",
-        help="GitHub API token (or set GITHUB_TOKEN env var)",
-    )
+LOAD_SCENARIOS = {
+    # The invalid-action probe doubles as the BrightData route health check
+    "brightdata": LoadScenario(
+        "brightdata", "GET", "/api/brightdata", {"action": "health"}, expected_status=(200, 400),
+    ),
+    "github-user": LoadScenario(
+        "github-user", "GET", "/api/github", {"action": "user", "username": TEST_GITHUB_USERNAME}, "github",
+    ),
+    "github-repos": LoadScenario(
+        "github-repos", "GET", "/api/github", {"action": "repos", "username": TEST_GITHUB_USERNAME}, "github",
+    ),
+    "github-full": LoadScenario(
+        "github-full", "GET", "/api/github", {"action": "full", "username": TEST_GITHUB_USERNAME}, "github",
+    ),
+    "health": LoadScenario("health", "GET", "/api/health", {}, "app"),
+}
 
-    args = parser.parse_args()
 
-    # Determine base URL
-    if args.url:
-        base_url = args.url
-        env_name = "custom"
-    else:
-        base_url = ENVIRONMENTS[args.env]
-        env_name = args.env
+@dataclass
+class LoadConfig:
+    """Load-test shape."""
+    vus: int = 10
+    rps: Optional[float] = None
+    ramp_up_s: float = 0.0
+    duration_s: float = 30.0
+    scenarios: list[str] = field(default_factory=lambda: list(LOAD_SCENARIOS))
+    timeline_interval_s: float = 1.0
+    late_after_ms: float = 10.0
 
-    # Get API keys
-    brightdata_key = args.brightdata_key or os.getenv("BRIGHTDATA_API_KEY")
-    github_token = args.github_token or os.getenv("GITHUB_TOKEN")
 
-    print(f"\n🚀 RecruitOS API Tester")
-    print(f"   Environment: {env_name}")
-    print(f"   Base URL: {base_url}")
-    print(f"   BrightData Key: {'✅ Set' if brightdata_key else '❌ Not set'}")
-    print(f"   GitHub Token: {'✅ Set' if github_token else '⚠️  Not set (limited rate)'}")
+@dataclass
+class TimelineBucket:
+    """Latency and error counts for one interval of a load run."""
+    offset_s: float
+    requests: int = 0
+    errors: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
 
-    # Create client
-    client = APIClient(base_url, brightdata_key, github_token)
 
-    # Run tests
-    if args.smoke_only:
-        suite = run_smoke_tests(client)
-    else:
-        suite = run_full_tests(client)
+@dataclass
+class LoadTestResult:
+    """Aggregated outcome of a load run."""
+    config: LoadConfig
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    by_scenario: dict[str, LatencyHistogram] = field(default_factory=dict)
+    status_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    errors_by_scenario: dict[str, int] = field(default_factory=dict)
+    timeline: dict[int, TimelineBucket] = field(default_factory=dict)
+    # Scenario -> server phase -> durations, from Server-Timing headers
+    server_phases: dict[str, dict[str, LatencyHistogram]] = field(default_factory=dict)
+    # Open-loop only: how far behind schedule requests went out, and how many never did
+    schedule_lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+    scheduled: int = 0
+    late: int = 0
+    started_at: Optional[datetime] = None
+    elapsed_s: float = 0.0
 
-    # Print summary
-    print_summary(suite)
+    @property
+    def missed(self) -> int:
+        return max(0, self.scheduled - self.total)
 
-    # Generate report if requested
-    if args.report:
-        report = generate_report(suite, env_name)
-        with open(args.report, "w") as f:
-            f.write(report)
-        print(f"\n📝 Report saved to: {args.report}")
+    @property
+    def total(self) -> int:
+        return self.histogram.count
 
-    # Exit with appropriate code
-    sys.exit(0 if suite.failed == 0 else 1)
+    @property
+    def errors(self) -> int:
+        return sum(self.errors_by_scenario.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.total if self.total else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed_s if self.elapsed_s else 0.0
+
+
+class RequestPacer:
+    """Hands out send times for an open-loop target rate with linear ramp-up."""
+
+    def __init__(self, rps: float, ramp_up_s: float, start: float):
+        self.rps = rps
+        self.ramp_up_s = ramp_up_s
+        self.start = start
+        self._issued = 0
+        self._lock = threading.Lock()
+
+    def next_slot(self) -> float:
+        with self._lock:
+            n = self._issued
+            self._issued += 1
+        # Invert the cumulative request count: rps * t^2 / (2 * ramp) while
+        # ramping, then rps * t after it
+        ramp_requests = self.rps * self.ramp_up_s / 2
+        if n < ramp_requests:
+            offset = math.sqrt(2 * self.ramp_up_s * n / self.rps)
+        else:
+            offset = self.ramp_up_s + (n - ramp_requests) / self.rps
+        return self.start + offset
+
+    def slots_before(self, offset: float) -> int:
+        """Number of send slots scheduled in the first ``offset`` seconds."""
+        if offset < self.ramp_up_s:
+            count = self.rps * offset ** 2 / (2 * self.ramp_up_s)
+        else:
+            count = self.rps * self.ramp_up_s / 2 + self.rps * (offset - self.ramp_up_s)
+        return math.ceil(count)
+
+
+def run_load_test(
+    client_factory: Callable[[], "APIClient"],
+    config: LoadConfig,
+    result: Optional[LoadTestResult] = None,
+) -> LoadTestResult:
+    """Drive the selected scenarios with virtual users and collect latencies.
+
+    Pass ``result`` to watch the timeline fill in from another thread.
+    """
+    scenarios = [LOAD_SCENARIOS[name] for name in config.scenarios]
+    result = result or LoadTestResult(config=config)
+    result.started_at = datetime.now()
+    for scenario in scenarios:
+        result.by_scenario[scenario.name] = LatencyHistogram()
+        result.status_counts[scenario.name] = {}
+        result.errors_by_scenario[scenario.name] = 0
+
+    lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = start + config.duration_s
+    pacer = RequestPacer(config.rps, config.ramp_up_s, start) if config.rps else None
+
+    def record(
+        scenario: LoadScenario, sent_at: float, latency_ms: float, status: str, ok: bool,
+        phases: Optional[dict[str, float]] = None, lag_ms: Optional[float] = None,
+    ) -> None:
+        bucket_index = int((sent_at - start) / config.timeline_interval_s)
+        with lock:
+            if lag_ms is not None:
+                result.schedule_lag.record(lag_ms)
+                if lag_ms > config.late_after_ms:
+                    result.late += 1
+            if phases:
+                histograms = result.server_phases.setdefault(scenario.name, {})
+                # Attribute the request itself; time spent queued behind schedule is not the network's
+                service_ms = latency_ms - (lag_ms or 0.0)
+                for phase, ms in {**phases, OUTSIDE_SERVER: service_ms - server_total_ms(phases)}.items():
+                    histograms.setdefault(phase, LatencyHistogram()).record(max(0.0, ms))
+            result.histogram.record(latency_ms)
+            result.by_scenario[scenario.name].record(latency_ms)
+            counts = result.status_counts[scenario.name]
+            counts[status] = counts.get(status, 0) + 1
+            bucket = result.timeline.get(bucket_index)
+            if bucket is None:
+                bucket = TimelineBucket(offset_s=bucket_index * config.timeline_interval_s)
+                result.timeline[bucket_index] = bucket
+            bucket.requests += 1
+            bucket.histogram.record(latency_ms)
+            if not ok:
+                result.errors_by_scenario[scenario.name] += 1
+                bucket.errors += 1
+
+    def virtual_user(vu_index: int) -> None:
+        client = client_factory()
+        client.deadline = deadline
+        exhausted: set[str] = set()
+        if not pacer and config.ramp_up_s > 0:
+            # Closed-loop mode: stagger VU start across the ramp-up window
+            time.sleep(config.ramp_up_s * vu_index / config.vus)
+        i = vu_index
+        while True:
+            slot = None
+            if pacer:
+                slot = pacer.next_slot()
+                if slot >= deadline:
+                    return
+                delay = slot - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            # Behind schedule, the pacer still hands out past slots; stop on time regardless
+            if time.perf_counter() >= deadline:
+                return
+            scenario = scenarios[i % len(scenarios)]
+            i += 1
+            if scenario.api_type in exhausted:
+                if all(sc.api_type in exhausted for sc in scenarios):
+                    return
+                continue
+            sent_at = time.perf_counter()
+            # Open-loop latency counts from the intended send time, so a backlog
+            # of late requests shows up in the histogram instead of being hidden
+            lag_ms = (sent_at - slot) * 1000 if slot is not None else None
+            try:
+                response = scenario.send(client)
+                latency_ms = (lag_ms or 0.0) + response.timing.total_ms
+                record(scenario, slot or sent_at, latency_ms, str(response.status_code),
+                       response.status_code in scenario.expected_status, server_timing(response), lag_ms)
+            except ThrottleTimeout as e:
+                latency_ms = (lag_ms or 0.0) + elapsed_ms(sent_at, e)
+                record(scenario, slot or sent_at, latency_ms, type(e).__name__, False, lag_ms=lag_ms)
+                if e.past_deadline:
+                    # The rate limit will not reopen before the run ends; keep to the other upstreams
+                    exhausted.add(e.upstream)
+            except requests.RequestException as e:
+                latency_ms = (lag_ms or 0.0) + elapsed_ms(sent_at, e)
+                record(scenario, slot or sent_at, latency_ms, type(e).__name__, False, lag_ms=lag_ms)
+
+    threads = [
+        threading.Thread(target=virtual_user, args=(n,), name=f"vu-{n}", daemon=True)
+        for n in range(config.vus)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result.elapsed_s = time.perf_counter() - start
+    if pacer:
+        result.scheduled = pacer.slots_before(config.duration_s)
+    return result
+
+
+# ============================================================
+# SOAK TESTING
+# ============================================================
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
 
 
+def parse_duration(text: str) -> float:
+    """Parse a duration such as ``90``, ``45s``, ``30m``, ``8h`` or ``1h30m`` into seconds."""
+    text = text.strip().lower()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    total, number = 0.0, ""
+    for char in text:
+        if char.isdigit() or char == ".":
+            number += char
+        elif char in DURATION_UNITS and number:
+            total += float(number) * DURATION_UNITS[char]
+            number = ""
+        else:
+            raise argparse.ArgumentTypeError(f"invalid duration: {text!r}")
+    if number or total <= 0:
+        raise argparse.ArgumentTypeError(f"invalid duration: {text!r}")
+    return total
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """Parse a weighted scenario mix such as ``github-user=3,health=1`` (weight defaults to 1)."""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name:
+            mix[name] = int(weight) if weight else 1
+    return mix
+
+
+@dataclass
+class SoakConfig:
+    """Soak-test shape."""
+    duration_s: float
+    mix: dict[str, int]
+    rps: float = 2.0
+    vus: int = 4
+    window_s: float = 300.0
+    health_interval_s: float = 60.0
+    drift_threshold_pct: float = 10.0
+    alpha: float = 0.05
+
+    def scenario_cycle(self) -> list[str]:
+        """Scenario names interleaved by weight, e.g. {a: 2, b: 1} -> [a, b, a]."""
+        cycle = []
+        remaining = dict(self.mix)
+        while any(remaining.values()):
+            for name in self.mix:
+                if remaining[name]:
+                    cycle.append(name)
+                    remaining[name] -= 1
+        return cycle
+
+
+@dataclass
+class HealthSample:
+    """One /api/health probe taken during a soak run."""
+    offset_s: float
+    latency_ms: float
+    status: str
+    ok: bool
+    rss_bytes: Optional[int] = None
+    heap_used_bytes: Optional[int] = None
+
+
+@dataclass
+class DriftTrend:
+    """Monotonic trend of one metric across a soak run."""
+    metric: str
+    unit: str
+    values: list[float]
+    slope_per_hour: float
+    change_pct: float
+    p_value: Optional[float]
+    drifting: bool
+
+
+@dataclass
+class SoakResult:
+    """Outcome of a soak run."""
+    config: SoakConfig
+    load: LoadTestResult
+    health: list[HealthSample] = field(default_factory=list)
+    trends: list[DriftTrend] = field(default_factory=list)
+
+    @property
+    def windows(self) -> list[TimelineBucket]:
+        """Complete windows only; a trailing partial window would skew the trend."""
+        return [
+            self.load.timeline[i] for i in sorted(self.load.timeline)
+            if self.load.timeline[i].offset_s + self.config.window_s <= self.load.elapsed_s + 1e-6
+        ]
+
+    @property
+    def drifting(self) -> list[DriftTrend]:
+        return [t for t in self.trends if t.drifting]
+
+
+def mann_kendall_increasing(values: list[float]) -> Optional[float]:
+    """One-sided Mann-Kendall p-value for ``values`` trending upwards over time.
+
+    Normal approximation with tie correction. Returns None below 4 points,
+    where no ordering can be significant at usual levels.
+    """
+    n = len(values)
+    if n < 4:
+        return None
+    s = sum(
+        (values[j] > values[i]) - (values[j] < values[i])
+        for i in range(n - 1)
+        for j in range(i + 1, n)
+    )
+    ties: dict[float, int] = {}
+    for v in values:
+        ties[v] = ties.get(v, 0) + 1
+    variance = (n * (n - 1) * (2 * n + 5) - sum(t * (t - 1) * (2 * t + 5) for t in ties.values())) / 18
+    if variance <= 0:
+        return 1.0
+    z = (s - 1) / math.sqrt(variance) if s > 0 else (s + 1) / math.sqrt(variance) if s < 0 else 0.0
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def sens_slope(values: list[float]) -> float:
+    """Median of pairwise slopes per step, robust to outlier windows."""
+    slopes = [
+        (values[j] - values[i]) / (j - i)
+        for i in range(len(values) - 1)
+        for j in range(i + 1, len(values))
+    ]
+    return statistics.median(slopes) if slopes else 0.0
+
+
+def detect_drift(metric: str, unit: str, values: list[float], step_s: float, threshold_pct: float, alpha: float) -> DriftTrend:
+    """Flag a metric whose upward trend is both significant and large over the run."""
+    slope = sens_slope(values)
+    p_value = mann_kendall_increasing(values)
+    baseline = statistics.median(values) if values else 0.0
+    span_change = slope * max(0, len(values) - 1)
+    if baseline > 0:
+        change_pct = span_change / baseline * 100
+    else:
+        change_pct = math.inf if span_change > 0 else 0.0
+    return DriftTrend(
+        metric=metric,
+        unit=unit,
+        values=values,
+        slope_per_hour=slope * 3600 / step_s,
+        change_pct=change_pct,
+        p_value=p_value,
+        drifting=p_value is not None and p_value < alpha and change_pct >= threshold_pct,
+    )
+
+
+def sample_health(client: APIClient, offset_s: float) -> HealthSample:
+    """Probe /api/health, picking up process memory figures if the route reports them."""
+    start = time.perf_counter()
+    try:
+        response = client.get("/api/health", api_type="app")
+    except requests.RequestException as e:
+        return HealthSample(offset_s, elapsed_ms(start, e), type(e).__name__, False)
+    sample = HealthSample(
+        offset_s, response.timing.total_ms, str(response.status_code), response.status_code == 200,
+    )
+    try:
+        memory = response.json().get("memory") or {}
+        sample.rss_bytes = memory.get("rss")
+        sample.heap_used_bytes = memory.get("heapUsed")
+    except (ValueError, AttributeError):
+        pass
+    return sample
+
+
+def run_soak_test(client_factory: Callable[[], APIClient], config: SoakConfig) -> SoakResult:
+    """Hold a steady weighted load for hours while sampling health, then test for drift."""
+    load_config = LoadConfig(
+        vus=config.vus,
+        rps=config.rps,
+        duration_s=config.duration_s,
+        scenarios=config.scenario_cycle(),
+        timeline_interval_s=config.window_s,
+    )
+    result = SoakResult(config=config, load=LoadTestResult(config=load_config))
+    done = threading.Event()
+
+    def health_sampler() -> None:
+        client = client_factory()
+        client.deadline = time.perf_counter() + config.duration_s
+        start = time.perf_counter()
+        reported = 0
+        while not done.is_set():
+            offset = time.perf_counter() - start
+            sample = sample_health(client, offset)
+            result.health.append(sample)
+            memory = f" rss={format_bytes(sample.rss_bytes)}" if sample.rss_bytes else ""
+            print(f"  [{offset / 60:6.1f}m] health {sample.status} {sample.latency_ms:.0f}ms{memory}")
+            # Windows before the current one are complete and no longer written to
+            while int(offset // config.window_s) > reported:
+                bucket = result.load.timeline.get(reported)
+                if bucket:
+                    print(
+                        f"  [{offset / 60:6.1f}m] window {reported}: n={bucket.requests} "
+                        f"p50={bucket.histogram.percentile(50):.1f}ms p99={bucket.histogram.percentile(99):.1f}ms "
+                        f"errors={bucket.errors}"
+                    )
+                reported += 1
+            done.wait(config.health_interval_s)
+
+    sampler = threading.Thread(target=health_sampler, name="health-sampler", daemon=True)
+    sampler.start()
+    run_load_test(client_factory, load_config, result=result.load)
+    done.set()
+    sampler.join()
+
+    windows = result.windows
+    series = [
+        ("p50 latency", "ms", [w.histogram.percentile(50) for w in windows], config.window_s),
+        ("p99 latency", "ms", [w.histogram.percentile(99) for w in windows], config.window_s),
+        ("error rate", "%", [w.errors / w.requests * 100 if w.requests else 0.0 for w in windows], config.window_s),
+        ("health latency", "ms", [s.latency_ms for s in result.health], config.health_interval_s),
+    ]
+    rss = [s.rss_bytes for s in result.health if s.rss_bytes]
+    if len(rss) == len(result.health):
+        series.append(("server RSS", "bytes", [float(v) for v in rss], config.health_interval_s))
+    heap = [s.heap_used_bytes for s in result.health if s.heap_used_bytes]
+    if len(heap) == len(result.health):
+        series.append(("server heap", "bytes", [float(v) for v in heap], config.health_interval_s))
+    result.trends = [
+        detect_drift(metric, unit, values, step_s, config.drift_threshold_pct, config.alpha)
+        for metric, unit, values, step_s in series
+    ]
+    return result
+
+
+# ============================================================
+# TRAFFIC CAPTURE & REPLAY
+# ============================================================
+
+SECRET_FIELD = re.compile(
+    r"^(key|api[-_]?key|.*token|.*secret|password|passwd|authorization|cookie|set-cookie|"
+    r"x-brightdata-key|x-github-token|session.*|signature|credentials?)$",
+    re.IGNORECASE,
+)
+REDACTED = "[REDACTED]"
+# Request headers that describe the recorded connection rather than the request
+HOP_HEADERS = {"host", "content-length", "connection", "accept-encoding", "transfer-encoding", "keep-alive"}
+
+
+def scrub(value: Any) -> Any:
+    """Copy of ``value`` with every secret-looking field replaced by a placeholder."""
+    if isinstance(value, dict):
+        return {k: REDACTED if SECRET_FIELD.match(str(k)) else scrub(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [scrub(v) for v in value]
+    return value
+
+
+def endpoint_key(method: str, path: str, query: dict) -> str:
+    """Group requests the way the routes dispatch them: by path and ``action``."""
+    key = f"{method} {path}"
+    if "action" in query:
+        key += f"?action={query['action']}"
+    return key
+
+
+def _decode_body(text: Optional[str]) -> Any:
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+@dataclass
+class ReplayEntry:
+    """One recorded request and the response it got."""
+    timestamp: float
+    method: str
+    path: str
+    query: dict = field(default_factory=dict)
+    headers: dict = field(default_factory=dict)
+    body: Any = None
+    status: Optional[int] = None
+    response: Any = None
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint_key(self.method, self.path, self.query)
+
+    @property
+    def api_type(self) -> str:
+        if self.path.startswith("/api/health"):
+            return "app"
+        return "github" if self.path.startswith("/api/github") else "brightdata"
+
+
+class TrafficRecorder:
+    """Appends every request an APIClient makes to a JSON Lines log, secrets scrubbed.
+
+    ``record`` only queues the exchange; a single writer thread scrubs,
+    serializes and appends through one buffered file, so recording during a
+    load or soak run neither blocks nor serializes the virtual users.
+    Call ``close`` to flush.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._file = open(path, "a", buffering=1 << 16)
+        self._writer = threading.Thread(target=self._write_loop, name="traffic-recorder", daemon=True)
+        self._writer.start()
+
+    def record(self, base_url: str, method: str, url: str, kwargs: dict, response: requests.Response) -> None:
+        self._queue.put((
+            time.time() - response.timing.total_ms / 1000,
+            base_url,
+            method,
+            url,
+            dict(kwargs.get("headers") or {}),
+            kwargs.get("json"),
+            response,
+        ))
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            timestamp, base_url, method, url, headers, body, response = item
+            parsed = urlparse(url)
+            content_type = response.headers.get("Content-Type", "")
+            entry = {
+                "timestamp": timestamp,
+                "method": method,
+                "path": parsed.path,
+                "query": scrub({k: v[0] for k, v in parse_qs(parsed.query).items()}),
+                "headers": scrub({k: v for k, v in headers.items() if k.lower() not in HOP_HEADERS}),
+                "body": scrub(body),
+                "status": response.status_code,
+                "duration_ms": response.timing.total_ms,
+                "response": scrub(_decode_body(response.text)) if "json" in content_type else None,
+                "target": base_url,
+            }
+            self._file.write(json.dumps(entry, default=str) + "\n")
+            self.count += 1
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write out everything queued so far and close the log."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+            self._file.close()
+
+
+def _parse_timestamp(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    return 0.0
+
+
+def load_har(document: dict) -> list[ReplayEntry]:
+    """Entries from a HAR 1.2 capture (browser devtools, proxies)."""
+    entries = []
+    for item in document.get("log", {}).get("entries", []):
+        request = item.get("request", {})
+        response = item.get("response", {})
+        parsed = urlparse(request.get("url", ""))
+        content = response.get("content", {})
+        text = content.get("text")
+        if text and content.get("encoding") == "base64":
+            try:
+                text = base64.b64decode(text).decode("utf-8")
+            except ValueError:
+                text = None
+        entries.append(ReplayEntry(
+            timestamp=_parse_timestamp(item.get("startedDateTime")),
+            method=request.get("method", "GET").upper(),
+            path=parsed.path or "/",
+            query={q["name"]: q["value"] for q in request.get("queryString", [])}
+            or {k: v[0] for k, v in parse_qs(parsed.query).items()},
+            headers={h["name"]: h["value"] for h in request.get("headers", []) if not h["name"].startswith(":")},
+            body=_decode_body((request.get("postData") or {}).get("text")),
+            status=response.get("status") or None,
+            response=_decode_body(text) if "json" in content.get("mimeType", "") else None,
+        ))
+    return entries
+
+
+def load_jsonl(lines: list[str]) -> list[ReplayEntry]:
+    """Entries from a JSON Lines log, as written by --record or an access-log export.
+
+    Each line needs ``method`` and either ``path`` (plus optional ``query``)
+    or a full ``url``; ``timestamp`` may be epoch seconds or ISO 8601.
+    """
+    entries = []
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if "path" in record:
+            path, query = record["path"], dict(record.get("query") or {})
+        else:
+            parsed = urlparse(record["url"])
+            path, query = parsed.path, {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        entries.append(ReplayEntry(
+            timestamp=_parse_timestamp(record.get("timestamp", record.get("time"))),
+            method=record.get("method", "GET").upper(),
+            path=path,
+            query=query,
+            headers=dict(record.get("headers") or {}),
+            body=record.get("body"),
+            status=record.get("status"),
+            response=record.get("response"),
+        ))
+    return entries
+
+
+def load_replay_log(path: str, prefix: str = "/api/") -> list[ReplayEntry]:
+    """Load a HAR or JSON Lines capture, keep requests under ``prefix`` and scrub secrets."""
+    with open(path) as f:
+        text = f.read()
+    is_har = path.endswith(".har")
+    if not is_har and text.lstrip().startswith("{"):
+        try:
+            is_har = "log" in json.loads(text)
+        except ValueError:
+            pass  # more than one JSON document: JSON Lines
+    entries = load_har(json.loads(text)) if is_har else load_jsonl(text.splitlines())
+    entries = [e for e in entries if e.path.startswith(prefix)]
+    for entry in entries:
+        entry.headers = {k: v for k, v in scrub(entry.headers).items() if k.lower() not in HOP_HEADERS}
+        entry.query = scrub(entry.query)
+        entry.body = scrub(entry.body)
+    entries.sort(key=lambda e: e.timestamp)
+    return entries
+
+
+def shape_diff(expected: Any, actual: Any, path: str = "$", limit: int = 10) -> list[str]:
+    """Structural differences between a recorded and a replayed JSON body.
+
+    Values are expected to change between runs; keys and types should not.
+    """
+    def kind(v: Any) -> str:
+        if v is None:
+            return "null"
+        if isinstance(v, bool):
+            return "bool"
+        if isinstance(v, (int, float)):
+            return "number"
+        return type(v).__name__
+
+    if expected == REDACTED:
+        return []
+    if kind(expected) != kind(actual):
+        return [f"{path}: {kind(expected)} → {kind(actual)}"]
+    diffs = []
+    if isinstance(expected, dict):
+        for key in expected.keys() - actual.keys():
+            diffs.append(f"{path}.{key}: missing")
+        for key in actual.keys() - expected.keys():
+            diffs.append(f"{path}.{key}: unexpected")
+        for key in expected.keys() & actual.keys():
+            diffs += shape_diff(expected[key], actual[key], f"{path}.{key}", limit)
+    elif isinstance(expected, list) and expected and actual:
+        diffs += shape_diff(expected[0], actual[0], f"{path}[0]", limit)
+    return sorted(diffs)[:limit]
+
+
+@dataclass
+class ReplayConfig:
+    """How to replay a capture."""
+    speed: float = 1.0  # 1 = original pacing, N = N times faster, 0 = as fast as possible
+    concurrency: int = 10
+    prefix: str = "/api/"
+    limit: Optional[int] = None
+
+
+@dataclass
+class ReplayMismatch:
+    """A replayed response that differs from its recording."""
+    index: int
+    endpoint: str
+    expected_status: Optional[int]
+    actual_status: str
+    diffs: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay run."""
+    config: ReplayConfig
+    entries: int = 0
+    recorded_span_s: float = 0.0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    by_endpoint: dict[str, LatencyHistogram] = field(default_factory=dict)
+    status_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+    mismatches: list[ReplayMismatch] = field(default_factory=list)
+    # Entries the replay itself failed on (not HTTP errors), as "#index endpoint: error"
+    errors: list[str] = field(default_factory=list)
+    started_at: Optional[datetime] = None
+    elapsed_s: float = 0.0
+
+    @property
+    def status_mismatches(self) -> int:
+        return sum(1 for m in self.mismatches if str(m.expected_status) != m.actual_status)
+
+    @property
+    def mismatch_rate(self) -> float:
+        return len(self.mismatches) / self.entries if self.entries else 0.0
+
+
+def run_replay(client_factory: Callable[[], APIClient], entries: list[ReplayEntry], config: ReplayConfig) -> ReplayResult:
+    """Re-issue recorded requests with their original, compressed or no pacing and diff the responses."""
+    if config.limit:
+        entries = entries[:config.limit]
+    result = ReplayResult(config=config, entries=len(entries), started_at=datetime.now())
+    if not entries:
+        return result
+    result.recorded_span_s = entries[-1].timestamp - entries[0].timestamp
+
+    lock = threading.Lock()
+    local = threading.local()
+
+    def replay_one(index: int, entry: ReplayEntry, due: float) -> None:
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = client_factory()
+        sent_at = time.perf_counter()
+        body = entry.body
+        if isinstance(body, dict) and body.get("apiKey") == REDACTED:
+            # Recorded keys are scrubbed; authenticate as this run's client instead
+            body = {k: v for k, v in body.items() if k != "apiKey"}
+            if client.brightdata_key:
+                body["apiKey"] = client.brightdata_key
+        query = {k: v for k, v in entry.query.items() if v != REDACTED}
+        url = f"{client.base_url}{entry.path}"
+        if query:
+            url = f"{url}?{urlencode(query)}"
+        # Fill scrubbed credentials from this run's client; requests recorded
+        # without credentials stay unauthenticated
+        credentials = {k.lower(): v for k, v in client._headers(entry.api_type).items()}
+        headers = {}
+        for name, value in entry.headers.items():
+            if value == REDACTED:
+                value = credentials.get(name.lower())
+            if value is not None:
+                headers[name] = value
+        try:
+            response = client._request(
+                entry.method, url, entry.api_type, headers=headers,
+                **({"json": body} if body is not None and not isinstance(body, str) else {"data": body}),
+            )
+            status = str(response.status_code)
+            latency_ms = response.timing.total_ms
+            diffs = []
+            if entry.response is not None:
+                try:
+                    diffs = shape_diff(entry.response, response.json())
+                except ValueError:
+                    diffs = ["$: not JSON"]
+        except requests.RequestException as e:
+            status, diffs = type(e).__name__, []
+            latency_ms = elapsed_ms(sent_at, e)
+
+        with lock:
+            result.histogram.record(latency_ms)
+            result.by_endpoint.setdefault(entry.endpoint, LatencyHistogram()).record(latency_ms)
+            counts = result.status_counts.setdefault(entry.endpoint, {})
+            counts[status] = counts.get(status, 0) + 1
+            if due:
+                result.lag.record(max(0.0, (sent_at - due) * 1000))
+            if diffs or (entry.status is not None and str(entry.status) != status):
+                result.mismatches.append(ReplayMismatch(index, entry.endpoint, entry.status, status, diffs))
+
+    start = time.perf_counter()
+    first = entries[0].timestamp
+    futures = {}
+    with ThreadPoolExecutor(max_workers=config.concurrency) as pool:
+        for index, entry in enumerate(entries):
+            due = 0.0
+            if config.speed > 0:
+                due = start + (entry.timestamp - first) / config.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            futures[pool.submit(replay_one, index, entry, due)] = (index, entry)
+
+    # A bug or bad capture entry must not vanish silently: count it as a mismatch
+    for future, (index, entry) in futures.items():
+        error = future.exception()
+        if error is not None:
+            result.errors.append(f"#{index} {entry.endpoint}: {type(error).__name__}: {error}")
+            result.mismatches.append(ReplayMismatch(index, entry.endpoint, entry.status, type(error).__name__,
+                                                    [f"replay failed: {error}"]))
+
+    result.elapsed_s = time.perf_counter() - start
+    result.mismatches.sort(key=lambda m: m.index)
+    return result
+
+
+# ============================================================
+# ASYNC JOB BENCHMARK
+# ============================================================
+
+@dataclass
+class PollPolicy:
+    """How often to poll BrightData progress while a job runs.
+
+    ``fixed`` polls every ``interval_s``; ``exponential`` multiplies the interval
+    by ``backoff`` up to ``max_interval_s``; ``adaptive`` sleeps through most of
+    the median completion time seen so far before falling back to exponential.
+    """
+    strategy: str = "exponential"
+    interval_s: float = 1.0
+    backoff: float = 1.5
+    max_interval_s: float = 15.0
+
+
+@dataclass
+class JobTiming:
+    """Timeline of one trigger→progress→snapshot job."""
+    snapshot_id: Optional[str] = None
+    completed: bool = False
+    error: Optional[str] = None
+    trigger_ms: float = 0.0
+    time_to_complete_ms: float = 0.0
+    polls: int = 0
+    wasted_polls: int = 0
+    polling_overhead_ms: float = 0.0
+    snapshot_ms: float = 0.0
+    snapshot_retries: int = 0
+
+
+@dataclass
+class JobBenchmarkResult:
+    """Aggregated jobs for one concurrency level."""
+    concurrency: int
+    jobs: list[JobTiming] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def completed(self) -> list[JobTiming]:
+        return [j for j in self.jobs if j.completed]
+
+    @property
+    def failed(self) -> int:
+        return len(self.jobs) - len(self.completed)
+
+    @property
+    def throughput_per_min(self) -> float:
+        return len(self.completed) / self.elapsed_s * 60 if self.elapsed_s else 0.0
+
+    def histogram(self) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        for job in self.completed:
+            histogram.record(job.time_to_complete_ms)
+        return histogram
+
+
+class CompletionEstimator:
+    """Running record of job durations, shared by adaptive pollers."""
+
+    def __init__(self):
+        self._durations: list[float] = []
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._durations.append(seconds)
+
+    def median(self) -> Optional[float]:
+        with self._lock:
+            return statistics.median(self._durations) if self._durations else None
+
+
+def run_brightdata_job(
+    client: APIClient,
+    url: str,
+    policy: PollPolicy,
+    estimator: CompletionEstimator,
+    timeout_s: float = 300.0,
+) -> JobTiming:
+    """Trigger one scrape, poll progress until ready, then fetch the snapshot."""
+    job = JobTiming()
+    key_body = {"apiKey": client.brightdata_key} if client.brightdata_key else {}
+    start = time.perf_counter()
+    deadline = start + timeout_s
+
+    try:
+        response = client.post("/api/brightdata/trigger", body={**key_body, "url": url})
+        job.trigger_ms = response.timing.total_ms
+        if response.status_code != 200:
+            job.error = f"trigger returned {response.status_code}"
+            return job
+        job.snapshot_id = response.json().get("snapshot_id")
+        if not job.snapshot_id:
+            job.error = "trigger returned no snapshot_id"
+            return job
+
+        interval = policy.interval_s
+        if policy.strategy == "adaptive":
+            expected = estimator.median()
+            if expected:
+                # Sleep through most of the typical run before the first poll
+                time.sleep(max(0.0, expected * 0.9 - (time.perf_counter() - start)))
+
+        while True:
+            response = client.post("/api/brightdata/progress", body={**key_body, "snapshotId": job.snapshot_id})
+            job.polls += 1
+            job.polling_overhead_ms += response.timing.total_ms
+            if response.status_code != 200:
+                job.error = f"progress returned {response.status_code}"
+                return job
+            status = response.json().get("status")
+            if status == "ready":
+                break
+            if status == "failed":
+                job.error = "BrightData reported the job as failed"
+                return job
+            job.wasted_polls += 1
+            if time.perf_counter() + interval > deadline:
+                job.error = f"timed out after {timeout_s:g}s"
+                return job
+            time.sleep(interval)
+            if policy.strategy != "fixed":
+                interval = min(interval * policy.backoff, policy.max_interval_s)
+
+        while True:
+            response = client.post("/api/brightdata/snapshot", body={**key_body, "snapshotId": job.snapshot_id})
+            job.snapshot_ms += response.timing.total_ms
+            if response.status_code == 200:
+                break
+            if response.status_code != 202 or time.perf_counter() + policy.interval_s > deadline:
+                job.error = f"snapshot returned {response.status_code}"
+                return job
+            job.snapshot_retries += 1
+            time.sleep(policy.interval_s)
+    except requests.RequestException as e:
+        job.error = str(e)
+        return job
+
+    job.completed = True
+    job.time_to_complete_ms = (time.perf_counter() - start) * 1000
+    estimator.add(job.time_to_complete_ms / 1000)
+    return job
+
+
+def run_job_benchmark(
+    client_factory: Callable[[], APIClient],
+    jobs: int,
+    concurrency_levels: list[int],
+    policy: PollPolicy,
+    url: str = TEST_LINKEDIN_URL,
+    timeout_s: float = 300.0,
+) -> list[JobBenchmarkResult]:
+    """Run ``jobs`` end-to-end scrapes at each concurrency level."""
+    results = []
+    for concurrency in concurrency_levels:
+        estimator = CompletionEstimator()
+        clients = threading.local()
+
+        def one_job(_: int) -> JobTiming:
+            if not hasattr(clients, "client"):
+                clients.client = client_factory()
+            return run_brightdata_job(clients.client, url, policy, estimator, timeout_s)
+
+        print(f"  {jobs} jobs @ concurrency {concurrency}...", end=" ", flush=True)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            timings = list(pool.map(one_job, range(jobs)))
+        result = JobBenchmarkResult(concurrency, timings, time.perf_counter() - start)
+        print(f"✅ {len(result.completed)} done" + (f", ❌ {result.failed} failed" if result.failed else ""))
+        results.append(result)
+    return results
+
+
+# ============================================================
+# CONNECTION BENCHMARK
+# ============================================================
+
+@dataclass
+class ConnectionStats:
+    """Setup versus request cost for one connection-handling variant."""
+    label: str
+    sent: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    close_headers: int = 0
+    setup: LatencyHistogram = field(default_factory=LatencyHistogram)
+    request: LatencyHistogram = field(default_factory=LatencyHistogram)
+    total: LatencyHistogram = field(default_factory=LatencyHistogram)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, response: requests.Response) -> None:
+        timing = response.timing
+        with self._lock:
+            self.sent += 1
+            if not timing.reused_connection:
+                self.new_connections += 1
+                self.setup.record(timing.dns_ms + timing.connect_ms + timing.tls_ms)
+            if response.headers.get("Connection", "").lower() == "close":
+                self.close_headers += 1
+            self.request.record(timing.ttfb_ms + timing.download_ms)
+            self.total.record(timing.total_ms)
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    @property
+    def reuse_ratio(self) -> float:
+        return 1 - self.new_connections / self.sent if self.sent else 0.0
+
+
+@dataclass
+class ConnectionBenchmarkResult:
+    """Cold/warm comparison per endpoint plus the pool-size sweep."""
+    cold: dict[str, ConnectionStats] = field(default_factory=dict)
+    warm: dict[str, ConnectionStats] = field(default_factory=dict)
+    pools: dict[int, ConnectionStats] = field(default_factory=dict)
+    concurrency: int = 1
+
+    def keepalive_honored(self, endpoint: str) -> bool:
+        warm = self.warm[endpoint]
+        return warm.sent > 0 and warm.new_connections == 0 and warm.close_headers == 0
+
+
+def run_connection_benchmark(
+    client_factory: Callable[[int], APIClient],
+    scenarios: list[str],
+    samples: int = 20,
+    pool_sizes: Optional[list[int]] = None,
+    concurrency: int = 8,
+) -> ConnectionBenchmarkResult:
+    """Measure cold and warm-pooled connections per endpoint, then sweep pool sizes.
+
+    ``client_factory`` builds an APIClient with the given connection pool size.
+    """
+    result = ConnectionBenchmarkResult(concurrency=concurrency)
+
+    for name in scenarios:
+        scenario = LOAD_SCENARIOS[name]
+        cold = result.cold[name] = ConnectionStats(f"{name} (cold)")
+        warm = result.warm[name] = ConnectionStats(f"{name} (warm)")
+        print(f"  {name}...", end=" ", flush=True)
+
+        # Cold: a fresh session, and so a fresh connection, for every request
+        for _ in range(samples):
+            client = client_factory(1)
+            try:
+                cold.record(scenario.send(client))
+            except requests.RequestException:
+                cold.record_error()
+            finally:
+                client.session.close()
+
+        # Warm: one pooled session, primed by an unrecorded request
+        client = client_factory(1)
+        try:
+            scenario.send(client)
+            for _ in range(samples):
+                warm.record(scenario.send(client))
+        except requests.RequestException:
+            warm.record_error()
+        finally:
+            client.session.close()
+        print("✅")
+
+    for pool_size in pool_sizes or []:
+        stats = result.pools[pool_size] = ConnectionStats(f"pool={pool_size}")
+        client = client_factory(pool_size)
+        print(f"  pool size {pool_size} x {concurrency} threads...", end=" ", flush=True)
+
+        def worker(offset: int) -> None:
+            for i in range(samples):
+                scenario = LOAD_SCENARIOS[scenarios[(offset + i) % len(scenarios)]]
+                try:
+                    stats.record(scenario.send(client))
+                except requests.RequestException:
+                    stats.record_error()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.session.close()
+        print("✅")
+
+    return result
+
+
+# ============================================================
+# CACHE PROBE
+# ============================================================
+
+# Headers that state hit/miss outright; Vercel and Cloudflare use their own names
+CACHE_STATUS_HEADERS = ("x-cache", "x-vercel-cache", "cf-cache-status", "x-nextjs-cache")
+
+
+@dataclass
+class CacheObservation:
+    """One probe request and how its cache status was inferred."""
+    latency_ms: float
+    verdict: str  # "hit" or "miss"
+    source: str  # "header" or "latency"
+    age_s: Optional[int] = None
+
+
+@dataclass
+class CacheProbeTarget:
+    """Cold and warm observations for one endpoint/input pair."""
+    endpoint: str
+    target: str
+    cold: Optional[CacheObservation] = None
+    warm: list[CacheObservation] = field(default_factory=list)
+    max_age_s: Optional[int] = None
+    after_ttl: Optional[CacheObservation] = None
+    error: Optional[str] = None
+
+    @property
+    def hit_ratio(self) -> float:
+        return sum(1 for o in self.warm if o.verdict == "hit") / len(self.warm) if self.warm else 0.0
+
+    @property
+    def speedup(self) -> float:
+        if not self.cold or not self.warm:
+            return 0.0
+        warm_median = statistics.median(o.latency_ms for o in self.warm)
+        return self.cold.latency_ms / warm_median if warm_median else 0.0
+
+
+def parse_max_age(cache_control: str) -> Optional[int]:
+    """Shared-cache TTL from a Cache-Control header (s-maxage wins over max-age)."""
+    directives = {}
+    for part in cache_control.split(","):
+        key, _, value = part.strip().partition("=")
+        directives[key.lower()] = value.strip('"')
+    if "no-store" in directives or "private" in directives:
+        return 0
+    for key in ("s-maxage", "max-age"):
+        if directives.get(key, "").isdigit():
+            return int(directives[key])
+    return None
+
+
+def classify_cache(response: requests.Response, cold_ms: Optional[float], hit_speedup: float) -> CacheObservation:
+    """Infer hit/miss from cache headers, falling back to latency against the cold request."""
+    latency_ms = response.timing.total_ms
+    age = response.headers.get("Age")
+    age_s = int(age) if age and age.isdigit() else None
+
+    for header in CACHE_STATUS_HEADERS:
+        status = response.headers.get(header)
+        if status:
+            verdict = "hit" if any(s in status.upper() for s in ("HIT", "STALE")) else "miss"
+            return CacheObservation(latency_ms, verdict, "header", age_s)
+    if age_s:
+        return CacheObservation(latency_ms, "hit", "header", age_s)
+    if cold_ms is not None and latency_ms * hit_speedup <= cold_ms:
+        return CacheObservation(latency_ms, "hit", "latency", age_s)
+    return CacheObservation(latency_ms, "miss", "latency", age_s)
+
+
+def cache_probe_requests(usernames: list[str], urls: list[str]) -> list[tuple[str, str, Callable[[APIClient], requests.Response]]]:
+    """(endpoint, target, send) triples covering every GitHub action and scrape URL."""
+    probes = []
+    for username in usernames:
+        for action in ("user", "repos", "full"):
+            probes.append((
+                f"github-{action}",
+                username,
+                lambda c, a=action, u=username: c.get("/api/github", {"action": a, "username": u}, api_type="github"),
+            ))
+    for url in urls:
+        probes.append((
+            "scrape",
+            url,
+            lambda c, u=url: c.post("/api/brightdata", {"action": "scrape"}, {"url": u, "tier": "1"}),
+        ))
+    return probes
+
+
+def run_cache_probe(
+    client: APIClient,
+    usernames: list[str],
+    urls: list[str],
+    repeats: int = 5,
+    hit_speedup: float = 2.0,
+    ttl_wait_s: float = 0.0,
+) -> list[CacheProbeTarget]:
+    """Issue a cold request then ``repeats`` warm ones per target; optionally re-probe after a wait."""
+    targets = []
+    for endpoint, target, send in cache_probe_requests(usernames, urls):
+        probe = CacheProbeTarget(endpoint, target)
+        print(f"  {endpoint} ({target})...", end=" ", flush=True)
+        try:
+            response = send(client)
+            probe.cold = classify_cache(response, None, hit_speedup)
+            probe.max_age_s = parse_max_age(response.headers.get("Cache-Control", ""))
+            for _ in range(repeats):
+                probe.warm.append(classify_cache(send(client), probe.cold.latency_ms, hit_speedup))
+        except requests.RequestException as e:
+            probe.error = str(e)
+        targets.append(probe)
+        print(f"{probe.hit_ratio * 100:.0f}% hits" if not probe.error else f"❌ {probe.error}")
+
+    if ttl_wait_s > 0:
+        print(f"  Waiting {ttl_wait_s:g}s to probe TTL expiry...")
+        time.sleep(ttl_wait_s)
+        probes = cache_probe_requests(usernames, urls)
+        for probe, (_, _, send) in zip(targets, probes):
+            if probe.cold and not probe.error:
+                try:
+                    probe.after_ttl = classify_cache(send(client), probe.cold.latency_ms, hit_speedup)
+                except requests.RequestException as e:
+                    probe.error = str(e)
+
+    return targets
+
+
+# ============================================================
+# REPORTING
+# ============================================================
+
+def format_bytes(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / 1024 / 1024:.1f}MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f}KB"
+    return f"{size}B"
+
+
+def apply_size_budget(suite: TestSuite, budget_bytes: int) -> list[TestResult]:
+    """Fail every result whose uncompressed body exceeds the budget."""
+    over = []
+    for result in suite.results:
+        payload = result.details.get("payload")
+        if payload and payload["body_bytes"] > budget_bytes:
+            result.passed = False
+            result.error = f"Response {format_bytes(payload['body_bytes'])} exceeds {format_bytes(budget_bytes)} budget"
+            over.append(result)
+    return over
+
+
+def generate_report(suite: TestSuite, env: str) -> str:
+    """Generate a markdown test report."""
+    report = f"""# API Test Report
+
+**Environment:** {env}
+**Date:** {suite.started_at.isoformat() if suite.started_at else 'N/A'}
+**Duration:** {suite.duration_ms:.0f}ms
+
+## Summary
+
+| Metric | Value |
+|--------|-------|
+| Total Tests | {suite.total} |
+| Passed | {suite.passed} ✅ |
+| Failed | {suite.failed} ❌ |
+| Pass Rate | {(suite.passed / suite.total * 100):.1f}% |
+
+## Results
+
+| Test | Status | Duration | Notes |
+|------|--------|----------|-------|
+"""
+
+    for result in suite.results:
+        status = "✅ Pass" if result.passed else "❌ Fail"
+        notes = result.error or result.response_preview or "-"
+        report += f"| {result.name} | {status} | {result.duration_ms:.0f}ms | {notes[:50]} |\n"
+
+    timed = [r for r in suite.results if "timing" in r.details]
+    if timed:
+        report += """
+## Timing Breakdown
+
+| Test | DNS | Connect | TLS | TTFB | Download | Total | Connection | Throttled |
+|------|-----|---------|-----|------|----------|-------|------------|-----------|
+"""
+        for result in timed:
+            t = result.details["timing"]
+            connection = "reused" if t["reused_connection"] else "new"
+            report += (
+                f"| {result.name} | {t['dns_ms']:.1f}ms | {t['connect_ms']:.1f}ms | {t['tls_ms']:.1f}ms | "
+                f"{t['ttfb_ms']:.1f}ms | {t['download_ms']:.1f}ms | {t['total_ms']:.1f}ms | {connection} | "
+                f"{t['throttle_ms']:.0f}ms |\n"
+            )
+
+    profiled = [r for r in suite.results if "payload" in r.details]
+    if profiled:
+        report += """
+## Payload Cost
+
+| Rank | Test | Wire | Uncompressed | Encoding | Ratio | JSON Decode |
+|------|------|------|--------------|----------|-------|-------------|
+"""
+        ranked = sorted(profiled, key=lambda r: r.details["payload"]["wire_bytes"], reverse=True)
+        for rank, result in enumerate(ranked, 1):
+            p = result.details["payload"]
+            decode = f"{p['json_decode_ms']:.2f}ms" if p["json_decode_ms"] is not None else "-"
+            report += (
+                f"| {rank} | {result.name} | {format_bytes(p['wire_bytes'])} | {format_bytes(p['body_bytes'])} | "
+                f"{p['content_encoding']} | {p['compression_ratio']:.1f}x | {decode} |\n"
+            )
+
+    server_timed = [r for r in suite.results if r.details.get("server_timing")]
+    if server_timed:
+        report += """
+## Server Timing
+
+Phases from the Server-Timing / X-Response-Time headers (medians over iterations).
+"Outside server" is the client-measured total minus the server's time: network, TLS and queueing.
+
+| Test | Server Phases | Server | Client Total | Outside Server |
+|------|---------------|--------|--------------|----------------|
+"""
+        for result in server_timed:
+            phases = result.details["server_timing"]
+            client_ms = statistics.median(result.details.get("samples_ms") or [result.duration_ms])
+            server_ms = server_total_ms(phases)
+            named = ", ".join(f"{name} {ms:.1f}ms" for name, ms in phases.items() if name != SERVER_TOTAL)
+            report += (
+                f"| {result.name} | {named or '-'} | {server_ms:.1f}ms | {client_ms:.1f}ms | "
+                f"{max(0.0, client_ms - server_ms):.1f}ms |\n"
+            )
+
+    if suite.failed > 0:
+        report += "\n## Failed Tests Details\n\n"
+        for result in suite.results:
+            if not result.passed:
+                report += f"""### {result.name}
+
+- **Status Code:** {result.status_code or 'N/A'}
+- **Error:** {result.error or 'Unknown'}
+- **Response:** {result.response_preview or 'N/A'}
+
+"""
+
+    return report
+
+
+def generate_encoding_section(negotiations: list[EncodingNegotiation]) -> str:
+    """Markdown table of Content-Encoding negotiation results."""
+    section = """
+## Content-Encoding Negotiation
+
+| Endpoint | Requested | Served | Wire Size |
+|----------|-----------|--------|-----------|
+"""
+    for n in negotiations:
+        marker = "" if n.requested == n.served else " ⚠️"
+        section += f"| {n.endpoint} | {n.requested} | {n.served}{marker} | {format_bytes(n.wire_bytes)} |\n"
+    return section
+
+
+def generate_throttle_section(scheduler: RateLimitScheduler) -> str:
+    """Markdown table of rate-limit waits per upstream, empty if none occurred."""
+    stats = {name: st for name, st in scheduler.stats.items() if st.waits or st.retries or st.gave_up}
+    if not stats:
+        return ""
+    section = """
+## Rate-Limit Throttling
+
+Waits are excluded from the request latencies above. Requests that would have
+waited past the throttle wait cap or the end of the run were given up.
+
+| Upstream | Waits | Total Wait | Retries after 429 | Given Up |
+|----------|-------|------------|-------------------|----------|
+"""
+    for name, st in stats.items():
+        section += f"| {name} | {st.waits} | {st.wait_ms:.0f}ms | {st.retries} | {st.gave_up} |\n"
+    return section
+
+
+LOAD_PERCENTILES = (50, 90, 99, 99.9)
+
+
+def generate_load_report(result: LoadTestResult, env: str) -> str:
+    """Generate a markdown load-test report."""
+    config = result.config
+    pct_headers = " | ".join(f"p{p:g}" for p in LOAD_PERCENTILES)
+    pct_rule = "|".join("-----" for _ in LOAD_PERCENTILES)
+    rps_target = f"{config.rps:g}/s" if config.rps else "unbounded"
+
+    report = f"""# API Load Test Report
+
+**Environment:** {env}
+**Date:** {result.started_at.isoformat() if result.started_at else 'N/A'}
+**Shape:** {config.vus} VUs, target {rps_target}, {config.ramp_up_s:g}s ramp-up, {config.duration_s:g}s duration
+
+## Summary
+
+| Metric | Value |
+|--------|-------|
+| Requests | {result.total} |
+| Throughput | {result.throughput:.1f} req/s |
+| Error Rate | {result.error_rate * 100:.2f}% |
+| Mean | {result.histogram.mean:.1f}ms |
+| Max | {result.histogram.max:.1f}ms |
+"""
+    if config.rps:
+        report += f"""| Scheduled | {result.scheduled} |
+| Missed (never sent) | {result.missed} |
+| Late (> {config.late_after_ms:g}ms behind schedule) | {result.late} |
+| Schedule Lag p99 | {result.schedule_lag.percentile(99):.1f}ms |
+"""
+    report += f"""
+## Latency by Endpoint
+
+| Endpoint | Requests | Errors | {pct_headers} |
+|----------|----------|--------|{pct_rule}|
+"""
+    for name, histogram in [*result.by_scenario.items(), ("all", result.histogram)]:
+        errors = result.errors if name == "all" else result.errors_by_scenario[name]
+        pcts = " | ".join(f"{histogram.percentile(p):.1f}ms" for p in LOAD_PERCENTILES)
+        report += f"| {name} | {histogram.count} | {errors} | {pcts} |\n"
+
+    report += "\n## Status Codes\n\n| Endpoint | Status | Count |\n|----------|--------|-------|\n"
+    for name, counts in result.status_counts.items():
+        for status, count in sorted(counts.items()):
+            report += f"| {name} | {status} | {count} |\n"
+
+    report += "\n## Latency Over Time\n\n| Offset | Requests | Errors | p50 | p99 |\n|--------|----------|--------|-----|-----|\n"
+    for index in sorted(result.timeline):
+        bucket = result.timeline[index]
+        report += (
+            f"| {bucket.offset_s:g}s | {bucket.requests} | {bucket.errors} | "
+            f"{bucket.histogram.percentile(50):.1f}ms | {bucket.histogram.percentile(99):.1f}ms |\n"
+        )
+
+    if result.server_phases:
+        report += "\n## Server Timing by Endpoint\n\n| Endpoint | Phase | Requests | p50 | p99 |\n|----------|-------|----------|-----|-----|\n"
+        for name, phases in result.server_phases.items():
+            for phase, histogram in phases.items():
+                report += (
+                    f"| {name} | {phase} | {histogram.count} | "
+                    f"{histogram.percentile(50):.1f}ms | {histogram.percentile(99):.1f}ms |\n"
+                )
+
+    return report
+
+
+def generate_soak_report(result: SoakResult, env: str) -> str:
+    """Generate a markdown soak-test report with per-window time series."""
+    config = result.config
+    load = result.load
+    mix = ", ".join(f"{name}×{weight}" for name, weight in config.mix.items())
+
+    report = f"""# API Soak Test Report
+
+**Environment:** {env}
+**Date:** {load.started_at.isoformat() if load.started_at else 'N/A'}
+**Shape:** {config.rps:g} req/s for {load.elapsed_s / 60:.1f}m, mix {mix}, {config.window_s:g}s windows
+
+## Summary
+
+| Metric | Value |
+|--------|-------|
+| Requests | {load.total} |
+| Throughput | {load.throughput:.2f} req/s |
+| Error Rate | {load.error_rate * 100:.2f}% |
+| p50 / p99 | {load.histogram.percentile(50):.1f}ms / {load.histogram.percentile(99):.1f}ms |
+| Health Samples | {len(result.health)} ({sum(1 for s in result.health if not s.ok)} failed) |
+
+## Drift
+
+Mann-Kendall trend test; a metric drifts when its rise is significant
+(p < {config.alpha:g}) and the Sen slope adds at least {config.drift_threshold_pct:g}% over the run.
+
+| Metric | Points | Slope / hour | Change over run | p-value | Drift |
+|--------|--------|--------------|-----------------|---------|-------|
+"""
+    for trend in result.trends:
+        if trend.unit == "bytes":
+            slope = ("+" if trend.slope_per_hour >= 0 else "-") + format_bytes(abs(int(trend.slope_per_hour)))
+        else:
+            slope = f"{trend.slope_per_hour:+.2f}{trend.unit}"
+        p_value = f"{trend.p_value:.4f}" if trend.p_value is not None else "n/a"
+        report += (
+            f"| {trend.metric} | {len(trend.values)} | {slope} | {trend.change_pct:+.1f}% | "
+            f"{p_value} | {'⚠️ yes' if trend.drifting else 'no'} |\n"
+        )
+
+    report += "\n## Latency Windows\n\n| Offset | Requests | Errors | p50 | p90 | p99 |\n|--------|----------|--------|-----|-----|-----|\n"
+    for bucket in result.windows:
+        report += (
+            f"| {bucket.offset_s / 60:g}m | {bucket.requests} | {bucket.errors} | "
+            f"{bucket.histogram.percentile(50):.1f}ms | {bucket.histogram.percentile(90):.1f}ms | "
+            f"{bucket.histogram.percentile(99):.1f}ms |\n"
+        )
+
+    report += "\n## Health Samples\n\n| Offset | Status | Latency | RSS | Heap Used |\n|--------|--------|---------|-----|-----------|\n"
+    for sample in result.health:
+        rss = format_bytes(sample.rss_bytes) if sample.rss_bytes else "-"
+        heap = format_bytes(sample.heap_used_bytes) if sample.heap_used_bytes else "-"
+        report += f"| {sample.offset_s / 60:.1f}m | {sample.status} | {sample.latency_ms:.1f}ms | {rss} | {heap} |\n"
+
+    return report
+
+
+def generate_replay_report(result: ReplayResult, source: str, env: str) -> str:
+    """Generate a markdown replay report with per-endpoint latency and response diffs."""
+    config = result.config
+    pacing = "max throughput" if config.speed <= 0 else f"{config.speed:g}× original timing"
+    pct_headers = " | ".join(f"p{p:g}" for p in LOAD_PERCENTILES)
+    pct_rule = "|".join("-----" for _ in LOAD_PERCENTILES)
+
+    report = f"""# API Traffic Replay Report
+
+**Environment:** {env}
+**Date:** {result.started_at.isoformat() if result.started_at else 'N/A'}
+**Capture:** {source} ({result.entries} requests over {result.recorded_span_s:.1f}s)
+**Pacing:** {pacing}, {config.concurrency} concurrent
+
+## Summary
+
+| Metric | Value |
+|--------|-------|
+| Replayed | {result.histogram.count} in {result.elapsed_s:.1f}s |
+| Mismatched Responses | {len(result.mismatches)} ({result.mismatch_rate * 100:.2f}%) |
+| Status Mismatches | {result.status_mismatches} |
+| Replay Errors | {len(result.errors)} |
+| Schedule Lag p99 | {result.lag.percentile(99):.1f}ms |
+
+## Latency by Endpoint
+
+| Endpoint | Requests | Statuses | {pct_headers} |
+|----------|----------|----------|{pct_rule}|
+"""
+    for name, histogram in sorted(result.by_endpoint.items()):
+        statuses = ", ".join(f"{s}×{n}" for s, n in sorted(result.status_counts[name].items()))
+        pcts = " | ".join(f"{histogram.percentile(p):.1f}ms" for p in LOAD_PERCENTILES)
+        report += f"| `{name}` | {histogram.count} | {statuses} | {pcts} |\n"
+
+    if result.mismatches:
+        report += "\n## Response Diffs\n\n| # | Endpoint | Recorded | Replayed | Differences |\n|---|----------|----------|----------|-------------|\n"
+        for m in result.mismatches:
+            diffs = "<br>".join(f"`{d}`" for d in m.diffs) or "-"
+            report += f"| {m.index} | `{m.endpoint}` | {m.expected_status} | {m.actual_status} | {diffs} |\n"
+
+    return report
+
+
+def generate_job_report(results: list[JobBenchmarkResult], policy: PollPolicy, env: str) -> str:
+    """Generate a markdown report for the async job benchmark."""
+    report = f"""# BrightData Job Benchmark Report
+
+**Environment:** {env}
+**Date:** {datetime.now().isoformat()}
+**Polling:** {policy.strategy}, {policy.interval_s:g}s initial, x{policy.backoff:g} backoff, {policy.max_interval_s:g}s max
+
+## Time to Complete
+
+| Concurrency | Jobs | Failed | Jobs/min | p50 | p90 | Max | Polls/job | Wasted/job | Poll overhead/job |
+|-------------|------|--------|----------|-----|-----|-----|-----------|------------|-------------------|
+"""
+    for result in results:
+        histogram = result.histogram()
+        done = result.completed or [JobTiming()]
+        report += (
+            f"| {result.concurrency} | {len(result.jobs)} | {result.failed} | {result.throughput_per_min:.1f} | "
+            f"{histogram.percentile(50) / 1000:.2f}s | {histogram.percentile(90) / 1000:.2f}s | {histogram.max / 1000:.2f}s | "
+            f"{statistics.mean(j.polls for j in done):.1f} | {statistics.mean(j.wasted_polls for j in done):.1f} | "
+            f"{statistics.mean(j.polling_overhead_ms for j in done):.0f}ms |\n"
+        )
+
+    errors = [(r.concurrency, j.error) for r in results for j in r.jobs if j.error]
+    if errors:
+        report += "\n## Failed Jobs\n\n| Concurrency | Error |\n|-------------|-------|\n"
+        for concurrency, error in errors:
+            report += f"| {concurrency} | {error[:80]} |\n"
+
+    return report
+
+
+def generate_connection_report(result: ConnectionBenchmarkResult, env: str) -> str:
+    """Generate a markdown report for the connection benchmark."""
+    report = f"""# Connection Reuse Benchmark Report
+
+**Environment:** {env}
+**Date:** {datetime.now().isoformat()}
+
+## Cold vs Warm Connections
+
+| Endpoint | Cold p50 | Setup p50 | Warm p50 | Saved per request | Warm reuse | Keep-alive |
+|----------|----------|-----------|----------|-------------------|------------|------------|
+"""
+    for name, cold in result.cold.items():
+        warm = result.warm[name]
+        saved = cold.total.percentile(50) - warm.total.percentile(50)
+        keepalive = "✅ Honored" if result.keepalive_honored(name) else "❌ Not honored"
+        report += (
+            f"| {name} | {cold.total.percentile(50):.1f}ms | {cold.setup.percentile(50):.1f}ms | "
+            f"{warm.total.percentile(50):.1f}ms | {saved:.1f}ms | {warm.reuse_ratio * 100:.0f}% | {keepalive} |\n"
+        )
+
+    if result.pools:
+        report += f"""
+## Pool Size Sweep ({result.concurrency} concurrent threads)
+
+| Pool Size | Requests | New Connections | Reuse | Setup p50 | p50 | p99 |
+|-----------|----------|-----------------|-------|-----------|-----|-----|
+"""
+        for pool_size, stats in result.pools.items():
+            report += (
+                f"| {pool_size} | {stats.sent} | {stats.new_connections} | {stats.reuse_ratio * 100:.0f}% | "
+                f"{stats.setup.percentile(50):.1f}ms | {stats.total.percentile(50):.1f}ms | {stats.total.percentile(99):.1f}ms |\n"
+            )
+
+    return report
+
+
+def generate_cache_report(targets: list[CacheProbeTarget], env: str) -> str:
+    """Generate a markdown report for the cache probe."""
+    report = f"""# Cache Effectiveness Report
+
+**Environment:** {env}
+**Date:** {datetime.now().isoformat()}
+
+## Per Endpoint
+
+| Endpoint | Targets | Warm Hit Ratio | Median Speedup | Advertised TTL | Evidence |
+|----------|---------|----------------|----------------|----------------|----------|
+"""
+    by_endpoint: dict[str, list[CacheProbeTarget]] = {}
+    for probe in targets:
+        if not probe.error:
+            by_endpoint.setdefault(probe.endpoint, []).append(probe)
+    for endpoint, probes in by_endpoint.items():
+        warm = [o for p in probes for o in p.warm]
+        hit_ratio = sum(1 for o in warm if o.verdict == "hit") / len(warm) if warm else 0.0
+        speedup = statistics.median(p.speedup for p in probes)
+        ttls = sorted({p.max_age_s for p in probes if p.max_age_s is not None})
+        ttl = ", ".join(f"{t}s" for t in ttls) if ttls else "none"
+        sources = sorted({o.source for o in warm})
+        report += (
+            f"| {endpoint} | {len(probes)} | {hit_ratio * 100:.0f}% | {speedup:.1f}x | {ttl} | {', '.join(sources) or '-'} |\n"
+        )
+
+    report += """
+## Per Target
+
+| Endpoint | Target | Cold | Cold Verdict | Warm p50 | Hit Ratio | Max Age Seen | After TTL Wait |
+|----------|--------|------|--------------|----------|-----------|--------------|----------------|
+"""
+    for probe in targets:
+        if probe.error:
+            report += f"| {probe.endpoint} | {probe.target} | ❌ {probe.error[:40]} | | | | | |\n"
+            continue
+        warm_p50 = statistics.median(o.latency_ms for o in probe.warm) if probe.warm else 0.0
+        ages = [o.age_s for o in probe.warm if o.age_s is not None]
+        after = probe.after_ttl.verdict if probe.after_ttl else "-"
+        report += (
+            f"| {probe.endpoint} | {probe.target} | {probe.cold.latency_ms:.1f}ms | {probe.cold.verdict} | "
+            f"{warm_p50:.1f}ms | {probe.hit_ratio * 100:.0f}% | {f'{max(ages)}s' if ages else '-'} | {after} |\n"
+        )
+
+    return report
+
+
+def print_summary(suite: TestSuite) -> None:
+    """Print test summary to console."""
+    print("\n" + "=" * 50)
+    print(f"📊 Test Results: {suite.name}")
+    print("=" * 50)
+    print(f"  Total:  {suite.total}")
+    print(f"  Passed: {suite.passed} ✅")
+    print(f"  Failed: {suite.failed} ❌")
+    print(f"  Rate:   {(suite.passed / suite.total * 100):.1f}%")
+    print(f"  Time:   {suite.duration_ms:.0f}ms")
+    print("=" * 50)
+
+
+def print_throttle_summary(scheduler: RateLimitScheduler) -> None:
+    """Print rate-limit waits per upstream, if there were any."""
+    for name, st in scheduler.stats.items():
+        if st.waits or st.retries or st.gave_up:
+            print(
+                f"  ⏱️  Throttled on {name}: {st.waits} waits, {st.wait_ms:.0f}ms total, "
+                f"{st.retries} retries, {st.gave_up} given up"
+            )
+
+
+def print_load_summary(result: LoadTestResult) -> None:
+    """Print load-test summary to console."""
+    print("\n" + "=" * 50)
+    print("📈 Load Test Results")
+    print("=" * 50)
+    print(f"  Requests:   {result.total}")
+    print(f"  Throughput: {result.throughput:.1f} req/s")
+    print(f"  Errors:     {result.errors} ({result.error_rate * 100:.2f}%)")
+    if result.config.rps:
+        print(f"  Scheduled:  {result.scheduled} ({result.missed} missed, {result.late} late, "
+              f"lag p99 {result.schedule_lag.percentile(99):.1f}ms)")
+        if result.missed:
+            print("  ⚠️  Target rate not reached; add --vus so latency reflects the requested load")
+    for p in LOAD_PERCENTILES:
+        print(f"  p{p:<9g} {result.histogram.percentile(p):.1f}ms")
+    print("-" * 50)
+    for name, histogram in result.by_scenario.items():
+        print(
+            f"  {name:<14} n={histogram.count:<6} p50={histogram.percentile(50):.1f}ms "
+            f"p99={histogram.percentile(99):.1f}ms errors={result.errors_by_scenario[name]}"
+        )
+        phases = result.server_phases.get(name)
+        if phases:
+            breakdown = ", ".join(f"{phase} {h.percentile(50):.1f}ms" for phase, h in phases.items())
+            print(f"  {'':<14} server p50: {breakdown}")
+    print("=" * 50)
+
+
+def print_soak_summary(result: SoakResult) -> None:
+    """Print soak-test summary to console."""
+    load = result.load
+    print("\n" + "=" * 50)
+    print("🕰️  Soak Test Results")
+    print("=" * 50)
+    print(f"  Requests:   {load.total} over {load.elapsed_s / 60:.1f}m")
+    print(f"  Errors:     {load.errors} ({load.error_rate * 100:.2f}%)")
+    print(f"  Windows:    {len(result.windows)} × {result.config.window_s:g}s")
+    print("-" * 50)
+    for trend in result.trends:
+        p_value = f"p={trend.p_value:.4f}" if trend.p_value is not None else "p=n/a"
+        status = "⚠️ " if trend.drifting else "✅"
+        print(f"  {status} {trend.metric:<15} {trend.change_pct:+.1f}% over run ({p_value})")
+    print("=" * 50)
+
+
+def print_replay_summary(result: ReplayResult) -> None:
+    """Print replay summary to console."""
+    print("\n" + "=" * 50)
+    print("🔁 Traffic Replay Results")
+    print("=" * 50)
+    print(f"  Replayed:   {result.histogram.count}/{result.entries} in {result.elapsed_s:.1f}s "
+          f"(recorded over {result.recorded_span_s:.1f}s)")
+    print(f"  Mismatches: {len(result.mismatches)} ({result.status_mismatches} status)")
+    for error in result.errors[:5]:
+        print(f"  ❌ {error}")
+    print(f"  Lag p99:    {result.lag.percentile(99):.1f}ms")
+    print("-" * 50)
+    for name, histogram in sorted(result.by_endpoint.items()):
+        print(f"  {name:<36} n={histogram.count:<5} p50={histogram.percentile(50):.1f}ms p99={histogram.percentile(99):.1f}ms")
+    for m in result.mismatches[:5]:
+        print(f"  ⚠️  #{m.index} {m.endpoint}: {m.expected_status} → {m.actual_status} {'; '.join(m.diffs[:3])}")
+    print("=" * 50)
+
+
+def print_job_summary(results: list[JobBenchmarkResult]) -> None:
+    """Print async job benchmark summary to console."""
+    print("\n" + "=" * 50)
+    print("⏳ BrightData Job Benchmark")
+    print("=" * 50)
+    for result in results:
+        histogram = result.histogram()
+        done = result.completed or [JobTiming()]
+        print(
+            f"  c={result.concurrency:<4} {result.throughput_per_min:6.1f} jobs/min  "
+            f"p50={histogram.percentile(50) / 1000:.2f}s p90={histogram.percentile(90) / 1000:.2f}s  "
+            f"wasted polls/job={statistics.mean(j.wasted_polls for j in done):.1f}  failed={result.failed}"
+        )
+    best = max(results, key=lambda r: r.throughput_per_min, default=None)
+    if best and len(results) > 1:
+        print(f"  Peak throughput at concurrency {best.concurrency}")
+    print("=" * 50)
+
+
+def print_connection_summary(result: ConnectionBenchmarkResult) -> None:
+    """Print connection benchmark summary to console."""
+    print("\n" + "=" * 50)
+    print("🔌 Connection Reuse Benchmark")
+    print("=" * 50)
+    for name, cold in result.cold.items():
+        warm = result.warm[name]
+        keepalive = "✅" if result.keepalive_honored(name) else "❌ keep-alive not honored"
+        print(
+            f"  {name:<14} cold={cold.total.percentile(50):.1f}ms (setup {cold.setup.percentile(50):.1f}ms) "
+            f"warm={warm.total.percentile(50):.1f}ms {keepalive}"
+        )
+    if result.pools:
+        print("-" * 50)
+        for pool_size, stats in result.pools.items():
+            print(
+                f"  pool={pool_size:<4} new connections={stats.new_connections:<5} "
+                f"p50={stats.total.percentile(50):.1f}ms p99={stats.total.percentile(99):.1f}ms"
+            )
+    print("=" * 50)
+
+
+def print_cache_summary(targets: list[CacheProbeTarget]) -> None:
+    """Print cache probe summary to console."""
+    print("\n" + "=" * 50)
+    print("🗄️  Cache Probe Results")
+    print("=" * 50)
+    for probe in targets:
+        if probe.error:
+            print(f"  {probe.endpoint:<13} {probe.target:<22} ❌ {probe.error}")
+            continue
+        ttl = f"ttl={probe.max_age_s}s" if probe.max_age_s is not None else "ttl=none"
+        after = f" after-wait={probe.after_ttl.verdict}" if probe.after_ttl else ""
+        print(
+            f"  {probe.endpoint:<13} {probe.target:<22} hits={probe.hit_ratio * 100:3.0f}% "
+            f"speedup={probe.speedup:.1f}x {ttl}{after}"
+        )
+    print("=" * 50)
+
+
+# ============================================================
+# EXPORTERS
+# ============================================================
+
+# Upper bounds in seconds for the OpenMetrics latency histograms
+EXPORT_BUCKETS_S = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def result_samples_ms(result: TestResult) -> list[float]:
+    """Every latency sample recorded for a result, falling back to its single duration."""
+    return result.details.get("samples_ms") or [result.duration_ms]
+
+
+def export_json(suite: TestSuite, env: str, base_url: str) -> str:
+    """Serialize a suite run to JSON, keeping timings at full precision."""
+    document = {
+        "suite": suite.name,
+        "env": env,
+        "base_url": base_url,
+        "revision": git_revision(),
+        "started_at": suite.started_at.isoformat() if suite.started_at else None,
+        "finished_at": suite.finished_at.isoformat() if suite.finished_at else None,
+        "summary": {
+            "total": suite.total,
+            "passed": suite.passed,
+            "failed": suite.failed,
+            "duration_ms": suite.duration_ms,
+        },
+        "results": [asdict(r) for r in suite.results],
+    }
+    return json.dumps(document, indent=2, default=str)
+
+
+def result_time_ms(result: TestResult) -> float:
+    """Time spent across every iteration of a result, including the run that failed."""
+    if "samples_ms" not in result.details:
+        return result.duration_ms
+    return sum(result.details["samples_ms"]) + (0.0 if result.passed else result.duration_ms)
+
+
+def export_junit(suite: TestSuite, env: str) -> str:
+    """Render a suite run as JUnit XML for CI test reporters.
+
+    Requests that raised (no status code) are ``<error>``s, other failed
+    checks ``<failure>``s; ``time`` covers all ``--iterations``.
+    """
+    errors = sum(1 for r in suite.results if not r.passed and r.status_code is None)
+    testsuite = ET.Element(
+        "testsuite",
+        name=f"{suite.name} ({env})",
+        tests=str(suite.total),
+        failures=str(suite.failed - errors),
+        errors=str(errors),
+        time=repr(sum(result_time_ms(r) for r in suite.results) / 1000),
+    )
+    if suite.started_at:
+        testsuite.set("timestamp", suite.started_at.isoformat())
+
+    for result in suite.results:
+        case = ET.SubElement(
+            testsuite,
+            "testcase",
+            classname=f"api_tester.{env}",
+            name=result.name,
+            time=repr(result_time_ms(result) / 1000),
+        )
+        properties = ET.SubElement(case, "properties")
+        if result.status_code is not None:
+            ET.SubElement(properties, "property", name="status_code", value=str(result.status_code))
+        samples = result_samples_ms(result)
+        ET.SubElement(properties, "property", name="samples_ms", value=",".join(repr(s) for s in samples))
+        timing = result.details.get("timing")
+        if timing:
+            for phase in ("dns_ms", "connect_ms", "tls_ms", "ttfb_ms", "download_ms", "throttle_ms"):
+                ET.SubElement(properties, "property", name=phase, value=repr(timing[phase]))
+        if not result.passed:
+            kind = "error" if result.status_code is None else "failure"
+            outcome = ET.SubElement(case, kind, message=result.error or "failed")
+            outcome.text = result.response_preview or result.error or ""
+
+    ET.indent(testsuite)
+    return ET.tostring(testsuite, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def _metric_labels(**labels: Any) -> str:
+    escaped = (
+        f'{k}="' + str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for k, v in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def export_openmetrics(suite: TestSuite, env: str, classic: bool = False) -> str:
+    """Render a suite run in the OpenMetrics text format.
+
+    OpenMetrics names a counter family without its ``_total`` suffix, which
+    the classic Prometheus text parser (node_exporter's textfile collector)
+    reads as an untyped metric; ``classic`` renders that format instead.
+    """
+    lines = [
+        "# TYPE recruitos_api_test_duration_seconds histogram",
+        *([] if classic else ["# UNIT recruitos_api_test_duration_seconds seconds"]),
+        "# HELP recruitos_api_test_duration_seconds Latency of each API test request.",
+    ]
+    for result in suite.results:
+        samples_s = [s / 1000 for s in result_samples_ms(result)]
+        for bound in EXPORT_BUCKETS_S:
+            count = sum(1 for s in samples_s if s <= bound)
+            lines.append(
+                f"recruitos_api_test_duration_seconds_bucket"
+                f"{_metric_labels(env=env, test=result.name, le=repr(bound))} {count}"
+            )
+        labels = _metric_labels(env=env, test=result.name)
+        lines.append(f"recruitos_api_test_duration_seconds_bucket{_metric_labels(env=env, test=result.name, le='+Inf')} {len(samples_s)}")
+        lines.append(f"recruitos_api_test_duration_seconds_count{labels} {len(samples_s)}")
+        lines.append(f"recruitos_api_test_duration_seconds_sum{labels} {sum(samples_s)!r}")
+
+    family = "recruitos_api_test_responses_total" if classic else "recruitos_api_test_responses"
+    lines += [
+        f"# TYPE {family} counter",
+        f"# HELP {family} Responses received per test and HTTP status code.",
+    ]
+    for result in suite.results:
+        status_counts = result.details.get("status_counts") or {
+            str(result.status_code) if result.status_code is not None else "none": 1
+        }
+        for status, count in sorted(status_counts.items()):
+            lines.append(
+                f"recruitos_api_test_responses_total"
+                f"{_metric_labels(env=env, test=result.name, status_code=status)} {count}"
+            )
+
+    lines += [
+        "# TYPE recruitos_api_test_passed gauge",
+        "# HELP recruitos_api_test_passed 1 if the test passed in this run, 0 otherwise.",
+    ]
+    for result in suite.results:
+        lines.append(f"recruitos_api_test_passed{_metric_labels(env=env, test=result.name)} {int(result.passed)}")
+
+    lines += [
+        "# TYPE recruitos_api_suite_tests gauge",
+        "# HELP recruitos_api_suite_tests Number of tests in the run by outcome.",
+        f"recruitos_api_suite_tests{_metric_labels(env=env, outcome='passed')} {suite.passed}",
+        f"recruitos_api_suite_tests{_metric_labels(env=env, outcome='failed')} {suite.failed}",
+    ]
+    if suite.finished_at:
+        lines += [
+            "# TYPE recruitos_api_suite_last_run_timestamp_seconds gauge",
+            *([] if classic else ["# UNIT recruitos_api_suite_last_run_timestamp_seconds seconds"]),
+            f"recruitos_api_suite_last_run_timestamp_seconds{_metric_labels(env=env)} {suite.finished_at.timestamp()!r}",
+        ]
+    if not classic:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_exports(args: argparse.Namespace, suite: TestSuite, env: str, base_url: str) -> None:
+    """Write every machine-readable export requested on the command line."""
+    exports = (
+        (args.json, lambda: export_json(suite, env, base_url), "JSON results"),
+        (args.junit, lambda: export_junit(suite, env), "JUnit XML"),
+        (args.openmetrics, lambda: export_openmetrics(suite, env), "OpenMetrics"),
+        (args.prometheus, lambda: export_openmetrics(suite, env, classic=True), "Prometheus metrics"),
+    )
+    for path, render, label in exports:
+        if path:
+            with open(path, "w") as f:
+                f.write(render())
+            print(f"📤 {label} saved to: {path}")
+
+
+# ============================================================
+# PERFORMANCE HISTORY
+# ============================================================
+
+@dataclass
+class BaselineComparison:
+    """Latency of one test in this run against its recorded baseline.
+
+    ``baseline_ms`` holds one median per baseline run. ``p_adjusted`` is
+    ``p_value`` after Holm correction across all tests in the comparison.
+    """
+    name: str
+    baseline_ms: list[float]
+    current_ms: list[float]
+    p_value: Optional[float]
+    change_pct: float
+    regressed: bool
+    p_adjusted: Optional[float] = None
+
+    @property
+    def baseline_median(self) -> float:
+        return statistics.median(self.baseline_ms)
+
+    @property
+    def current_median(self) -> float:
+        return statistics.median(self.current_ms)
+
+
+def git_revision() -> Optional[str]:
+    """Short git revision of the checkout being tested, if known."""
+    sha = os.getenv("GITHUB_SHA") or os.getenv("VERCEL_GIT_COMMIT_SHA")
+    if sha:
+        return sha[:12]
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def history_record(suite: TestSuite, env: str, base_url: str) -> dict:
+    """Serialize a suite run into one history record."""
+    return {
+        "started_at": suite.started_at.isoformat() if suite.started_at else None,
+        "suite": suite.name,
+        "env": env,
+        "base_url": base_url,
+        "revision": git_revision(),
+        "tests": {
+            r.name: {
+                "passed": r.passed,
+                "status_code": r.status_code,
+                "samples_ms": r.details.get("samples_ms", [r.duration_ms] if r.passed else []),
+            }
+            for r in suite.results
+        },
+    }
+
+
+def load_history(path: str) -> list[dict]:
+    """Read all run records from a JSON Lines history file."""
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(path: str, record: dict) -> None:
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def mann_whitney_greater(current: list[float], baseline: list[float]) -> Optional[float]:
+    """One-sided Mann-Whitney U p-value for ``current`` being slower than ``baseline``.
+
+    Uses the normal approximation with tie and continuity correction, which is
+    reasonable from roughly 8 samples per side. Returns None if either side is
+    too small to ever reach significance.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 < 3 or n2 < 3:
+        return None
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def wilcoxon_signed_rank_greater(differences: list[float]) -> Optional[float]:
+    """One-sided Wilcoxon signed-rank p-value for paired ``differences`` being above zero.
+
+    Zero differences are dropped; uses the normal approximation with tie and
+    continuity correction. Returns None for fewer than 5 pairs, which can never
+    reach p < 0.05.
+    """
+    if len(differences) < 5:
+        return None
+    nonzero = sorted((abs(d), d > 0) for d in differences if d != 0)
+    n = len(nonzero)
+    if n == 0:
+        return 1.0
+    w_plus = 0.0
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and nonzero[j + 1][0] == nonzero[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        w_plus += rank * sum(1 for k in range(i, j + 1) if nonzero[k][1])
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    variance = n * (n + 1) * (2 * n + 1) / 24 - tie_term / 48
+    if variance <= 0:
+        return 1.0
+    z = (w_plus - n * (n + 1) / 4 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def holm_adjust(p_values: list[Optional[float]]) -> list[Optional[float]]:
+    """Holm-Bonferroni adjusted p-values, in input order; None entries are skipped.
+
+    Comparing p_adjusted < alpha for every test keeps the chance of any false
+    regression across the whole run at alpha.
+    """
+    order = sorted((p, i) for i, p in enumerate(p_values) if p is not None)
+    adjusted: list[Optional[float]] = [None] * len(p_values)
+    running = 0.0
+    for rank, (p, i) in enumerate(order):
+        running = max(running, min(1.0, (len(order) - rank) * p))
+        adjusted[i] = running
+    return adjusted
+
+
+def compare_to_baseline(
+    suite: TestSuite,
+    history: list[dict],
+    env: str,
+    base_url: str,
+    runs: int = 5,
+    threshold_pct: float = 10.0,
+    alpha: float = 0.05,
+    min_ms: float = 5.0,
+) -> list[BaselineComparison]:
+    """Compare each test's samples against the last ``runs`` matching history records.
+
+    Samples from one run share that run's conditions, so each baseline run
+    contributes only its median. A test regresses when it is significantly
+    slower after Holm correction across tests (p < alpha), and its median grew
+    by more than ``threshold_pct`` percent and by at least ``min_ms``.
+    """
+    matching = [r for r in history if r.get("env") == env and r.get("base_url") == base_url]
+    baseline_runs = matching[-runs:]
+
+    comparisons = []
+    for result in suite.results:
+        current = result.details.get("samples_ms", [])
+        baseline = []
+        for run in baseline_runs:
+            samples = run.get("tests", {}).get(result.name, {}).get("samples_ms")
+            if samples:
+                baseline.append(statistics.median(samples))
+        if not current or not baseline:
+            continue
+        p_value = mann_whitney_greater(current, baseline)
+        baseline_median = statistics.median(baseline)
+        change_pct = (statistics.median(current) - baseline_median) / baseline_median * 100 if baseline_median else 0.0
+        comparisons.append(BaselineComparison(result.name, baseline, current, p_value, change_pct, False))
+
+    for c, p_adjusted in zip(comparisons, holm_adjust([c.p_value for c in comparisons])):
+        c.p_adjusted = p_adjusted
+        c.regressed = (
+            p_adjusted is not None and p_adjusted < alpha
+            and c.change_pct > threshold_pct
+            and c.current_median - c.baseline_median >= min_ms
+        )
+    return comparisons
+
+
+def generate_baseline_section(comparisons: list[BaselineComparison]) -> str:
+    """Markdown table of baseline comparisons for appending to a report."""
+    section = """
+## Baseline Comparison
+
+Baseline p50 is the median of the recent runs' medians; p-values are Holm-adjusted across tests.
+
+| Test | Baseline p50 | Current p50 | Change | p-value | Verdict |
+|------|--------------|-------------|--------|---------|---------|
+"""
+    for c in comparisons:
+        p_value = f"{c.p_adjusted:.3f}" if c.p_adjusted is not None else "n/a"
+        verdict = "🔺 Regressed" if c.regressed else "✅ OK"
+        section += (
+            f"| {c.name} | {c.baseline_median:.1f}ms | {c.current_median:.1f}ms | "
+            f"{c.change_pct:+.1f}% | {p_value} | {verdict} |\n"
+        )
+    return section
+
+
+def print_baseline_comparison(comparisons: list[BaselineComparison]) -> None:
+    """Print baseline comparison to console."""
+    print("\n" + "=" * 50)
+    print("📉 Baseline Comparison")
+    print("=" * 50)
+    if not comparisons:
+        print("  No matching baseline runs recorded yet")
+    for c in comparisons:
+        p_value = f"p={c.p_adjusted:.3f}" if c.p_adjusted is not None else "p=n/a"
+        marker = "🔺" if c.regressed else "  "
+        print(
+            f"{marker} {c.name:<34} {c.baseline_median:7.1f}ms → {c.current_median:7.1f}ms "
+            f"({c.change_pct:+.1f}%, {p_value})"
+        )
+    if any(c.p_value is None for c in comparisons):
+        print("  ℹ️  n/a: too few samples for a significance test; record 3+ runs and use --iterations 10 or more")
+    print("=" * 50)
+
+
+# ============================================================
+# ENVIRONMENT COMPARISON
+# ============================================================
+
+@dataclass
+class TargetComparison:
+    """One test on one target against the same test on the reference target.
+
+    ``p_slower`` and ``p_faster`` are Holm-adjusted across all comparisons.
+    """
+    name: str
+    target: str
+    reference_ms: list[float]
+    target_ms: list[float]
+    reference_bytes: Optional[int]
+    target_bytes: Optional[int]
+    p_slower: Optional[float]
+    p_faster: Optional[float]
+    change_pct: float
+    regressed: bool
+
+    @property
+    def reference_median(self) -> float:
+        return statistics.median(self.reference_ms) if self.reference_ms else 0.0
+
+    @property
+    def target_median(self) -> float:
+        return statistics.median(self.target_ms) if self.target_ms else 0.0
+
+
+def run_interleaved(
+    clients: dict[str, APIClient],
+    tests: list[Callable[[APIClient], TestResult]],
+    iterations: int = 1,
+    suite_name: str = "Full API Tests",
+) -> dict[str, TestSuite]:
+    """Run the same tests against several targets in lockstep.
+
+    Every target issues the same test iteration at the same moment, so
+    network and client-side noise hits all of them alike instead of
+    whichever target happened to run during a slow patch.
+    """
+    suites = {name: TestSuite(name=f"{suite_name} ({name})", started_at=datetime.now()) for name in clients}
+    barrier = threading.Barrier(len(clients))
+
+    def run_target(name: str, client: APIClient) -> None:
+        try:
+            for test_fn in tests:
+                result = run_test(test_fn, client, iterations, before_each=barrier.wait)
+                # run_test stops at the first failure; keep meeting the other
+                # targets at the barrier for the iterations it skipped
+                for _ in range(max(1, iterations) - sum(result.details["status_counts"].values())):
+                    barrier.wait()
+                suites[name].results.append(result)
+        except BaseException:
+            # Release the other targets rather than leave them waiting forever
+            barrier.abort()
+            raise
+        finally:
+            suites[name].finished_at = datetime.now()
+
+    threads = [
+        threading.Thread(target=run_target, args=(name, client), name=f"target-{name}", daemon=True)
+        for name, client in clients.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return suites
+
+
+def compare_targets(
+    suites: dict[str, TestSuite],
+    threshold_pct: float,
+    alpha: float,
+    min_ms: float = 5.0,
+) -> list[TargetComparison]:
+    """Compare every target to the first one, test by test.
+
+    Lockstep runs pair up iteration by iteration, so significance comes from a
+    Wilcoxon signed-rank test on the per-iteration differences, Holm-adjusted
+    across tests. A test regresses when it is significantly slower and its
+    median grew by more than ``threshold_pct`` percent and by at least ``min_ms``.
+    """
+    reference_name, *others = suites
+    reference = {r.name: r for r in suites[reference_name].results}
+    comparisons = []
+    for name in others:
+        for result in suites[name].results:
+            ref = reference.get(result.name)
+            if ref is None:
+                continue
+            ref_ms = ref.details.get("samples_ms", [])
+            cur_ms = result.details.get("samples_ms", [])
+            ref_median = statistics.median(ref_ms) if ref_ms else 0.0
+            cur_median = statistics.median(cur_ms) if cur_ms else 0.0
+            change_pct = (cur_median - ref_median) / ref_median * 100 if ref_median else 0.0
+            # run_test stops at the first failure, so pair only the iterations both completed
+            differences = [cur - ref for cur, ref in zip(cur_ms, ref_ms)]
+            comparisons.append(TargetComparison(
+                name=result.name,
+                target=name,
+                reference_ms=ref_ms,
+                target_ms=cur_ms,
+                reference_bytes=ref.details.get("payload", {}).get("wire_bytes"),
+                target_bytes=result.details.get("payload", {}).get("wire_bytes"),
+                p_slower=wilcoxon_signed_rank_greater(differences),
+                p_faster=wilcoxon_signed_rank_greater([-d for d in differences]),
+                change_pct=change_pct,
+                regressed=False,
+            ))
+
+    slower = holm_adjust([c.p_slower for c in comparisons])
+    faster = holm_adjust([c.p_faster for c in comparisons])
+    for c, p_slower, p_faster in zip(comparisons, slower, faster):
+        c.p_slower, c.p_faster = p_slower, p_faster
+        c.regressed = (
+            p_slower is not None and p_slower < alpha
+            and c.change_pct > threshold_pct
+            and c.target_median - c.reference_median >= min_ms
+        )
+    return comparisons
+
+
+def significance_marker(p_value: Optional[float]) -> str:
+    """Conventional stars: * p<0.05, ** p<0.01, *** p<0.001."""
+    if p_value is None:
+        return ""
+    return "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*" if p_value < 0.05 else ""
+
+
+def comparison_verdict(c: TargetComparison) -> str:
+    if c.regressed:
+        return "🔺 slower"
+    if significance_marker(c.p_slower):
+        return "▲ slower (under threshold)"
+    if significance_marker(c.p_faster):
+        return "▼ faster"
+    return "≈ same"
+
+
+def generate_comparison_report(suites: dict[str, TestSuite], targets: dict[str, str], comparisons: list[TargetComparison]) -> str:
+    """Side-by-side markdown report of latency and payload per target."""
+    reference = next(iter(suites))
+    report = f"""# API Environment Comparison
+
+**Date:** {datetime.now().isoformat()}
+**Reference:** {reference} ({targets[reference]})
+**Compared:** {", ".join(f"{name} ({targets[name]})" for name in list(suites)[1:])}
+
+Tests ran in lockstep on all targets. Significance is a one-sided
+Wilcoxon signed-rank test on the paired per-iteration latencies, Holm-adjusted
+across tests (* p<0.05, ** p<0.01, *** p<0.001); 🔺 marks slowdowns that are
+significant and above both the percentage and absolute thresholds.
+
+## Pass/Fail
+
+| Target | Passed | Failed |
+|--------|--------|--------|
+"""
+    for name, suite in suites.items():
+        report += f"| {name} | {suite.passed} | {suite.failed} |\n"
+
+    report += """
+## Latency (p50)
+
+| Test | Target | Reference p50 | Target p50 | Change | Significance | Verdict |
+|------|--------|---------------|------------|--------|--------------|---------|
+"""
+    for c in comparisons:
+        marker = significance_marker(c.p_slower) or significance_marker(c.p_faster) or "-"
+        report += (
+            f"| {c.name} | {c.target} | {c.reference_median:.1f}ms | {c.target_median:.1f}ms | "
+            f"{c.change_pct:+.1f}% | {marker} | {comparison_verdict(c)} |\n"
+        )
+
+    report += """
+## Payload (wire bytes)
+
+| Test | Target | Reference | Target | Change |
+|------|--------|-----------|--------|--------|
+"""
+    for c in comparisons:
+        if c.reference_bytes is None or c.target_bytes is None:
+            continue
+        change = (c.target_bytes - c.reference_bytes) / c.reference_bytes * 100 if c.reference_bytes else 0.0
+        report += (
+            f"| {c.name} | {c.target} | {format_bytes(c.reference_bytes)} | "
+            f"{format_bytes(c.target_bytes)} | {change:+.1f}% |\n"
+        )
+    return report
+
+
+def print_comparison(suites: dict[str, TestSuite], comparisons: list[TargetComparison]) -> None:
+    """Print the side-by-side comparison to console."""
+    reference = next(iter(suites))
+    print("\n" + "=" * 50)
+    print(f"⚖️  Environment Comparison (reference: {reference})")
+    print("=" * 50)
+    for name, suite in suites.items():
+        print(f"  {name:<20} {suite.passed}/{suite.total} passed")
+    print("-" * 50)
+    for c in comparisons:
+        marker = significance_marker(c.p_slower) or significance_marker(c.p_faster)
+        print(
+            f"  {c.name:<34} {c.target:<12} {c.reference_median:7.1f}ms → {c.target_median:7.1f}ms "
+            f"({c.change_pct:+.1f}%{' ' + marker if marker else ''}) {comparison_verdict(c)}"
+        )
+    if any(c.p_slower is None for c in comparisons):
+        print("  ℹ️  No significance without samples; use --iterations 10 or more")
+    print("=" * 50)
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def is_loopback(host: Optional[str]) -> bool:
+    """Whether ``host`` names this machine, so a stand-in can listen on it."""
+    if not host:
+        return True
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="RecruitOS API Tester",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--env",
+        action="append",
+        choices=["local", "staging", "production"],
+        help="Environment to test against (default: local); repeat to compare environments, the first is the reference",
+    )
+    parser.add_argument(
+        "--url",
+        action="append",
+        help="Custom API base URL (overrides a single --env); repeat to compare several",
+    )
+    parser.add_argument(
+        "--smoke-only",
+        action="store_true",
+        help="Run only smoke tests (quick verification)",
+    )
+    parser.add_argument(
+        "--report",
+        help="Output file for markdown report",
+    )
+    parser.add_argument(
+        "--brightdata-key",
+        help="BrightData API key (or set BRIGHTDATA_API_KEY env var)",
+    )
+    parser.add_argument(
+        "--github-token",
+        help="GitHub API token (or set GITHUB_TOKEN env var)",
+    )
+    parser.add_argument(
+        "--session-token",
+        help="NextAuth session token, or a full name=value cookie, for routes that require sign-in "
+             "such as the BrightData job routes (or set RECRUITOS_SESSION_TOKEN env var)",
+    )
+    parser.add_argument(
+        "--no-throttle",
+        action="store_true",
+        help="Disable rate-limit pacing from upstream X-RateLimit-*/Retry-After headers",
+    )
+    parser.add_argument(
+        "--throttle-retries",
+        type=int,
+        default=2,
+        help="Retries for rate-limited (429) responses once the limit allows (default: 2)",
+    )
+    parser.add_argument(
+        "--max-throttle-wait",
+        type=float,
+        default=60.0,
+        help="Longest rate-limit wait in seconds before a request fails instead (default: 60)",
+    )
+    parser.add_argument(
+        "--stand-in",
+        action="store_true",
+        help="Serve the target URL from the local stand-in backend (scripts/stand_in_server.py)",
+    )
+    parser.add_argument(
+        "--stand-in-profile",
+        choices=["none", "fast", "realistic", "degraded"],
+        default="none",
+        help="Simulated upstream latency profile for --stand-in (default: none)",
+    )
+    parser.add_argument(
+        "--stand-in-rate-limit",
+        type=int,
+        default=0,
+        help="Let --stand-in rate-limit each upstream to N requests per minute (default: off)",
+    )
+    parser.add_argument(
+        "--stand-in-cache-ttl",
+        type=float,
+        default=0.0,
+        help="Let --stand-in cache GitHub and scrape responses for this many seconds (default: off)",
+    )
+
+    payload = parser.add_argument_group("payload profiling")
+    payload.add_argument(
+        "--size-budget-kb",
+        type=float,
+        help="Fail tests whose uncompressed response body exceeds this many KB",
+    )
+    payload.add_argument(
+        "--encoding-probe",
+        action="store_true",
+        help="Also check gzip/br Content-Encoding negotiation for each --endpoints scenario",
+    )
+
+    export = parser.add_argument_group("machine-readable export")
+    export.add_argument(
+        "--json",
+        metavar="FILE",
+        help="Write full-precision results as JSON",
+    )
+    export.add_argument(
+        "--junit",
+        metavar="FILE",
+        help="Write results as JUnit XML for CI test reporting",
+    )
+    export.add_argument(
+        "--openmetrics",
+        metavar="FILE",
+        help="Write latency histograms, status counters and pass/fail gauges in OpenMetrics text format "
+             "(needs an OpenMetrics-aware scraper)",
+    )
+    export.add_argument(
+        "--prometheus",
+        metavar="FILE",
+        help="Write the same metrics in the classic Prometheus text format, e.g. for node_exporter's textfile collector",
+    )
+
+    history = parser.add_argument_group("performance history")
+    history.add_argument(
+        "--iterations",
+        type=int,
+        default=1,
+        help="Run each test N times to collect a latency distribution (default: 1)",
+    )
+    history.add_argument(
+        "--history",
+        help="JSON Lines file to append this run's per-test latencies to",
+    )
+    history.add_argument(
+        "--compare-baseline",
+        action="store_true",
+        help="Compare against recent runs in --history and fail on significant slowdowns",
+    )
+    history.add_argument(
+        "--baseline-runs",
+        type=int,
+        default=5,
+        help="Number of most recent matching runs that form the baseline (default: 5)",
+    )
+    history.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=10.0,
+        help="Median slowdown in percent that fails the gate when significant (default: 10)",
+    )
+    history.add_argument(
+        "--significance",
+        type=float,
+        default=0.05,
+        help="Holm-adjusted p-value below which a slowdown counts as significant (default: 0.05)",
+    )
+    history.add_argument(
+        "--regression-min-ms",
+        type=float,
+        default=5.0,
+        help="Smallest median slowdown in milliseconds that can fail the gate (default: 5)",
+    )
+
+    jobs = parser.add_argument_group("async job benchmark")
+    jobs.add_argument(
+        "--job-benchmark",
+        action="store_true",
+        help="Benchmark the BrightData trigger→progress→snapshot pipeline",
+    )
+    jobs.add_argument(
+        "--jobs",
+        type=int,
+        default=5,
+        help="Jobs to run per concurrency level (default: 5)",
+    )
+    jobs.add_argument(
+        "--job-concurrency",
+        default="1",
+        help="Comma-separated concurrency levels to sweep, e.g. 1,4,16 (default: 1)",
+    )
+    jobs.add_argument(
+        "--poll-strategy",
+        choices=["fixed", "exponential", "adaptive"],
+        default="exponential",
+        help="Progress polling strategy (default: exponential)",
+    )
+    jobs.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Initial progress poll interval in seconds (default: 1)",
+    )
+    jobs.add_argument(
+        "--poll-backoff",
+        type=float,
+        default=1.5,
+        help="Poll interval multiplier for exponential/adaptive polling (default: 1.5)",
+    )
+    jobs.add_argument(
+        "--poll-max-interval",
+        type=float,
+        default=15.0,
+        help="Upper bound on the poll interval in seconds (default: 15)",
+    )
+    jobs.add_argument(
+        "--job-timeout",
+        type=float,
+        default=300.0,
+        help="Give up on a job after this many seconds (default: 300)",
+    )
+
+    conn = parser.add_argument_group("connection benchmark")
+    conn.add_argument(
+        "--connection-benchmark",
+        action="store_true",
+        help="Compare cold and warm-pooled connections per endpoint and sweep pool sizes",
+    )
+    conn.add_argument(
+        "--connection-samples",
+        type=int,
+        default=20,
+        help="Requests per endpoint and variant (default: 20)",
+    )
+    conn.add_argument(
+        "--pool-sizes",
+        default="1,4,10",
+        help="Comma-separated connection pool sizes to sweep (default: 1,4,10)",
+    )
+    conn.add_argument(
+        "--connection-concurrency",
+        type=int,
+        default=8,
+        help="Threads sharing one client during the pool sweep (default: 8)",
+    )
+
+    cache = parser.add_argument_group("cache probe")
+    cache.add_argument(
+        "--cache-probe",
+        action="store_true",
+        help="Probe server-side caching of GitHub and scrape endpoints",
+    )
+    cache.add_argument(
+        "--cache-usernames",
+        default=TEST_GITHUB_USERNAME,
+        help=f"Comma-separated GitHub usernames to probe (default: {TEST_GITHUB_USERNAME})",
+    )
+    cache.add_argument(
+        "--cache-urls",
+        default="https://example.com",
+        help="Comma-separated URLs to probe through the scrape action (default: https://example.com)",
+    )
+    cache.add_argument(
+        "--cache-repeats",
+        type=int,
+        default=5,
+        help="Warm requests after the cold one, per target (default: 5)",
+    )
+    cache.add_argument(
+        "--cache-hit-speedup",
+        type=float,
+        default=2.0,
+        help="Without cache headers, count a warm request as a hit when this many times faster than cold (default: 2)",
+    )
+    cache.add_argument(
+        "--cache-ttl-wait",
+        type=float,
+        default=0.0,
+        help="Seconds to wait before re-probing each target to observe expiry (default: skip)",
+    )
+
+    replay = parser.add_argument_group("traffic capture & replay")
+    replay.add_argument(
+        "--record",
+        metavar="FILE",
+        help="Append every request made in this run to a JSON Lines capture (secrets scrubbed)",
+    )
+    replay.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="Replay a JSON Lines or HAR capture against the target and diff the responses",
+    )
+    replay.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Time compression for --replay: 1 keeps original timing, 10 is 10x faster, 0 is max throughput (default: 1)",
+    )
+    replay.add_argument(
+        "--replay-concurrency",
+        type=int,
+        default=10,
+        help="Maximum requests in flight during --replay (default: 10)",
+    )
+    replay.add_argument(
+        "--replay-prefix",
+        default="/api/",
+        help="Only replay requests whose path starts with this (default: /api/)",
+    )
+    replay.add_argument(
+        "--replay-limit",
+        type=int,
+        help="Replay at most this many requests from the capture",
+    )
+
+    soak = parser.add_argument_group("soak testing")
+    soak.add_argument(
+        "--soak",
+        type=parse_duration,
+        metavar="DURATION",
+        help="Run a steady soak test for this long (e.g. 30m, 8h) and check for latency/error/memory drift "
+             "(server memory needs HEALTH_EXPOSE_MEMORY=true on the app)",
+    )
+    soak.add_argument(
+        "--soak-mix",
+        help="Weighted scenario mix, e.g. github-user=3,brightdata=1,health=1 (default: --endpoints, equal weights)",
+    )
+    soak.add_argument(
+        "--soak-rps",
+        type=float,
+        default=2.0,
+        help="Steady request rate across the mix (default: 2)",
+    )
+    soak.add_argument(
+        "--soak-window",
+        type=parse_duration,
+        default=300.0,
+        metavar="DURATION",
+        help="Window for latency percentiles and trend points (default: 5m)",
+    )
+    soak.add_argument(
+        "--health-interval",
+        type=parse_duration,
+        default=60.0,
+        metavar="DURATION",
+        help="How often to sample /api/health (default: 1m)",
+    )
+    soak.add_argument(
+        "--drift-threshold",
+        type=float,
+        default=10.0,
+        help="Minimum rise over the run, in percent, for a significant trend to fail (default: 10)",
+    )
+
+    load = parser.add_argument_group("load testing")
+    load.add_argument(
+        "--load",
+        action="store_true",
+        help="Run a load test instead of the functional tests",
+    )
+    load.add_argument(
+        "--vus",
+        type=int,
+        default=10,
+        help="Number of concurrent virtual users (default: 10)",
+    )
+    load.add_argument(
+        "--rps",
+        type=float,
+        help="Target requests per second across all VUs (default: as fast as possible)",
+    )
+    load.add_argument(
+        "--ramp-up",
+        type=float,
+        default=0.0,
+        help="Seconds to ramp from zero to the target rate (default: 0)",
+    )
+    load.add_argument(
+        "--duration",
+        type=float,
+        default=30.0,
+        help="Load test duration in seconds (default: 30)",
+    )
+    load.add_argument(
+        "--endpoints",
+        default=",".join(LOAD_SCENARIOS),
+        help=f"Comma-separated endpoint scenarios for load and connection runs (default: {','.join(LOAD_SCENARIOS)})",
+    )
+    load.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.01,
+        help="Fail the load run above this error fraction (default: 0.01)",
+    )
+
+    args = parser.parse_args()
+    if args.compare_baseline and not args.history:
+        parser.error("--compare-baseline requires --history")
+
+    # Determine targets; with several, the first is the comparison reference
+    if args.url and len(args.url) == 1 and len(args.env or []) <= 1:
+        targets = {"custom": args.url[0]}
+    else:
+        targets = {env: ENVIRONMENTS[env] for env in args.env or []}
+        targets.update((urlparse(url).netloc or url, url) for url in args.url or [])
+    targets = targets or {"local": ENVIRONMENTS["local"]}
+    env_name, base_url = next(iter(targets.items()))
+    compare_mode = len(targets) > 1
+    other_modes = (args.cache_probe, args.connection_benchmark, args.job_benchmark, args.load, args.soak, args.replay)
+    if compare_mode and any(other_modes):
+        parser.error("multiple --env/--url targets only run the functional tests side by side")
+
+    # Get API keys
+    brightdata_key = args.brightdata_key or os.getenv("BRIGHTDATA_API_KEY")
+    github_token = args.github_token or os.getenv("GITHUB_TOKEN")
+    session_token = args.session_token or os.getenv("RECRUITOS_SESSION_TOKEN")
+    if args.stand_in and not session_token:
+        # The stand-in accepts any session, like a signed-in browser would have
+        session_token = "stand-in"
+
+    print(f"\n🚀 RecruitOS API Tester")
+    for name, url in targets.items():
+        print(f"   Environment: {name}")
+        print(f"   Base URL: {url}")
+    print(f"   BrightData Key: {'✅ Set' if brightdata_key else '❌ Not set'}")
+    print(f"   GitHub Token: {'✅ Set' if github_token else '⚠️  Not set (limited rate)'}")
+    print(f"   Session: {'✅ Set' if session_token else '⚠️  Not set (sign-in routes will return 401)'}")
+
+    # One scheduler for every client so all of them draw from the same upstream budgets
+    scheduler = RateLimitScheduler(enabled=not args.no_throttle, max_wait_s=args.max_throttle_wait)
+    recorder = TrafficRecorder(args.record) if args.record else None
+    if recorder:
+        # Every mode ends in sys.exit, which runs this before the process goes
+        atexit.register(recorder.close)
+
+    def make_client(pool_size: int = 10, url: Optional[str] = None) -> APIClient:
+        return APIClient(
+            url or base_url,
+            brightdata_key,
+            github_token,
+            pool_size=pool_size,
+            scheduler=scheduler,
+            throttle_retries=args.throttle_retries,
+            recorder=recorder,
+            session_token=session_token,
+        )
+
+    if args.stand_in:
+        from stand_in_server import StandInConfig, start_stand_in
+
+        remote = [name for name, url in targets.items() if not is_loopback(urlparse(url).hostname)]
+        if remote:
+            parser.error(f"--stand-in only binds to loopback targets, not {', '.join(remote)}")
+        for url in targets.values():
+            target = urlparse(url)
+            host, port = target.hostname or "127.0.0.1", target.port or 80
+            try:
+                _, stand_in_url = start_stand_in(
+                    host,
+                    port,
+                    StandInConfig(
+                        profile=args.stand_in_profile,
+                        cache_ttl_s=args.stand_in_cache_ttl,
+                        rate_limit=args.stand_in_rate_limit,
+                    ),
+                )
+            except OSError as e:
+                parser.error(
+                    f"--stand-in could not listen on {host}:{port} ({e.strerror or e}); "
+                    "is a dev server or another --url already using that port?"
+                )
+            print(f"   Stand-in: 🧩 {stand_in_url} (profile: {args.stand_in_profile})")
+
+    scenarios = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in LOAD_SCENARIOS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+
+    soak_mix = parse_mix(args.soak_mix) if args.soak_mix else dict.fromkeys(scenarios, 1)
+    unknown = [name for name in soak_mix if name not in LOAD_SCENARIOS]
+    if unknown:
+        parser.error(f"unknown --soak-mix scenarios: {', '.join(unknown)}")
+
+    if compare_mode:
+        tests = SMOKE_TESTS if args.smoke_only else FULL_TESTS
+        print(f"\n⚖️  Running {len(tests)} tests × {args.iterations} iterations on {len(targets)} targets in lockstep...")
+        suites = run_interleaved(
+            {name: make_client(url=url) for name, url in targets.items()},
+            tests,
+            args.iterations,
+            "Smoke Tests" if args.smoke_only else "Full API Tests",
+        )
+        comparisons = compare_targets(suites, args.regression_threshold, args.significance, args.regression_min_ms)
+        print_comparison(suites, comparisons)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_comparison_report(suites, targets, comparisons) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        failed = any(suite.failed for suite in suites.values()) or any(c.regressed for c in comparisons)
+        sys.exit(1 if failed else 0)
+
+    if args.cache_probe:
+        print("\n🗄️  Running Cache Probe...\n")
+        probes = run_cache_probe(
+            make_client(),
+            [u.strip() for u in args.cache_usernames.split(",") if u.strip()],
+            [u.strip() for u in args.cache_urls.split(",") if u.strip()],
+            repeats=args.cache_repeats,
+            hit_speedup=args.cache_hit_speedup,
+            ttl_wait_s=args.cache_ttl_wait,
+        )
+        print_cache_summary(probes)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_cache_report(probes, env_name) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        sys.exit(0 if all(not p.error for p in probes) else 1)
+
+    if args.connection_benchmark:
+        try:
+            pool_sizes = [int(size) for size in args.pool_sizes.split(",") if size.strip()]
+        except ValueError:
+            parser.error("--pool-sizes must be comma-separated integers")
+        print("\n🔌 Running Connection Reuse Benchmark...\n")
+        result = run_connection_benchmark(
+            make_client,
+            scenarios,
+            samples=args.connection_samples,
+            pool_sizes=pool_sizes,
+            concurrency=args.connection_concurrency,
+        )
+        print_connection_summary(result)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_connection_report(result, env_name) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        sys.exit(0 if all(result.keepalive_honored(name) for name in result.warm) else 1)
+
+    if args.job_benchmark:
+        if not session_token:
+            print("   ⚠️  The BrightData job routes require sign-in; pass --session-token or every job will fail with 401")
+        try:
+            levels = [int(level) for level in args.job_concurrency.split(",") if level.strip()]
+        except ValueError:
+            parser.error("--job-concurrency must be comma-separated integers")
+        policy = PollPolicy(
+            strategy=args.poll_strategy,
+            interval_s=args.poll_interval,
+            backoff=args.poll_backoff,
+            max_interval_s=args.poll_max_interval,
+        )
+        print(f"\n⏳ Running BrightData Job Benchmark ({policy.strategy} polling)...\n")
+        results = run_job_benchmark(
+            make_client,
+            args.jobs,
+            levels,
+            policy,
+            timeout_s=args.job_timeout,
+        )
+        print_job_summary(results)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_job_report(results, policy, env_name) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        sys.exit(0 if all(r.failed == 0 for r in results) else 1)
+
+    if args.replay:
+        config = ReplayConfig(
+            speed=args.replay_speed,
+            concurrency=args.replay_concurrency,
+            prefix=args.replay_prefix,
+            limit=args.replay_limit,
+        )
+        entries = load_replay_log(args.replay, config.prefix)
+        print(f"\n🔁 Replaying {len(entries)} requests from {args.replay}...")
+        result = run_replay(make_client, entries, config)
+        print_replay_summary(result)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_replay_report(result, args.replay, env_name) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        sys.exit(0 if result.histogram.count and result.mismatch_rate <= args.max_error_rate else 1)
+
+    if args.soak:
+        config = SoakConfig(
+            duration_s=args.soak,
+            mix=soak_mix,
+            rps=args.soak_rps,
+            vus=args.vus,
+            window_s=args.soak_window,
+            health_interval_s=args.health_interval,
+            drift_threshold_pct=args.drift_threshold,
+            alpha=args.significance,
+        )
+        print(f"\n🕰️  Running Soak Test ({config.rps:g} req/s for {config.duration_s / 60:g}m)...")
+        result = run_soak_test(make_client, config)
+        print_soak_summary(result)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_soak_report(result, env_name) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        failed = result.drifting or result.load.error_rate > args.max_error_rate
+        sys.exit(1 if failed or not result.load.total else 0)
+
+    if args.load:
+        config = LoadConfig(
+            vus=args.vus,
+            rps=args.rps,
+            ramp_up_s=args.ramp_up,
+            duration_s=args.duration,
+            scenarios=scenarios,
+        )
+        print(f"\n📈 Running Load Test ({config.vus} VUs, {config.duration_s:g}s)...")
+        result = run_load_test(make_client, config)
+        print_load_summary(result)
+        print_throttle_summary(scheduler)
+
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(generate_load_report(result, env_name) + generate_throttle_section(scheduler))
+            print(f"\n📝 Report saved to: {args.report}")
+
+        sys.exit(0 if result.total and result.error_rate <= args.max_error_rate else 1)
+
+    # Create client
+    client = make_client()
+
+    # Run tests
+    if args.smoke_only:
+        suite = run_smoke_tests(client, args.iterations)
+    else:
+        suite = run_full_tests(client, args.iterations)
+
+    if args.size_budget_kb:
+        for result in apply_size_budget(suite, int(args.size_budget_kb * 1024)):
+            print(f"  📦 {result.name}: {result.error}")
+
+    negotiations = []
+    if args.encoding_probe:
+        negotiations = probe_encodings(client, scenarios)
+
+    # Print summary
+    print_summary(suite)
+    print_throttle_summary(scheduler)
+
+    # Compare against recorded runs before this one is added
+    comparisons = []
+    if args.compare_baseline:
+        comparisons = compare_to_baseline(
+            suite,
+            load_history(args.history),
+            env_name,
+            base_url,
+            runs=args.baseline_runs,
+            threshold_pct=args.regression_threshold,
+            alpha=args.significance,
+            min_ms=args.regression_min_ms,
+        )
+        print_baseline_comparison(comparisons)
+
+    if args.history:
+        append_history(args.history, history_record(suite, env_name, base_url))
+        print(f"\n🗂️  Run recorded in: {args.history}")
+
+    # Generate report if requested
+    if args.report:
+        report = generate_report(suite, env_name)
+        if args.compare_baseline:
+            report += generate_baseline_section(comparisons)
+        if negotiations:
+            report += generate_encoding_section(negotiations)
+        report += generate_throttle_section(scheduler)
+        with open(args.report, "w") as f:
+            f.write(report)
+        print(f"\n📝 Report saved to: {args.report}")
+
+    write_exports(args, suite, env_name, base_url)
+
+    # Exit with appropriate code
+    regressed = any(c.regressed for c in comparisons)
+    sys.exit(0 if suite.failed == 0 and not regressed else 1)
+
 if __name__ == "__main__":
     main()
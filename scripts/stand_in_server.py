@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+RecruitOS Stand-in Backend
+
+A dependency-free local server for offline API testing. It plays two roles:
+
+- RecruitOS stand-in: answers the /api/* routes exercised by api_tester.py, so
+  the tester (and its load mode) can run without a Next.js build or database.
+- Mock upstream: serves GitHub (/users/...) and BrightData (/datasets/v3/...)
+  payloads, so a local Next.js server can be pointed at it with
+  GITHUB_API_BASE_URL and BRIGHTDATA_API_BASE_URL and measured in isolation.
+
+Upstream latency follows a named profile; error injection, rate limiting (with
+GitHub-style X-RateLimit-* and Retry-After headers) and a TTL response cache on
+the /api/* routes (reported via X-Cache/Age) are configurable.
+
+Usage:
+    python scripts/stand_in_server.py --port 3000
+    python scripts/stand_in_server.py --port 4010 --profile realistic --error-rate 0.02 --rate-limit 60
+    python scripts/api_tester.py --env local --stand-in --load
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+BRIGHTDATA_DATASET_ID = "gd_l1viktl72bvl7bjuj0"
+
+
+@dataclass
+class Latency:
+    """Log-normal latency distribution described by its median and shape."""
+    median_ms: float = 0.0
+    sigma: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        return self.median_ms * math.exp(self.sigma * rng.gauss(0, 1))
+
+
+@dataclass
+class UpstreamProfile:
+    """Latency per upstream plus how long BrightData scrape jobs take."""
+    github: Latency
+    brightdata: Latency
+    job_seconds: tuple[float, float]
+
+
+LATENCY_PROFILES = {
+    "none": UpstreamProfile(Latency(), Latency(), (0.0, 0.0)),
+    "fast": UpstreamProfile(Latency(15, 0.2), Latency(40, 0.2), (0.5, 1.5)),
+    "realistic": UpstreamProfile(Latency(120, 0.4), Latency(350, 0.5), (8.0, 25.0)),
+    "degraded": UpstreamProfile(Latency(600, 0.8), Latency(1500, 0.9), (30.0, 90.0)),
+}
+
+
+@dataclass
+class StandInConfig:
+    """Behaviour knobs for the stand-in's simulated upstreams."""
+    profile: str = "none"
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 502, 503)
+    rate_limit: int = 0  # requests per window per upstream; 0 disables
+    rate_limit_window_s: float = 60.0
+    cache_ttl_s: float = 0.0  # cache /api/github and scrape responses; 0 disables
+    seed: Optional[int] = None
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+def github_user_payload(username: str) -> dict:
+    """GitHub-shaped user payload."""
+    return {
+        "login": username,
+        "id": 583231,
+        "node_id": "MDQ6VXNlcjU4MzIzMQ==",
+        "avatar_url": "https://avatars.githubusercontent.com/u/583231?v=4",
+        "html_url": f"https://github.com/{username}",
+        "type": "User",
+        "name": "The Octocat",
+        "company": "@github",
+        "blog": "https://github.blog",
+        "location": "San Francisco",
+        "email": None,
+        "hireable": None,
+        "bio": None,
+        "twitter_username": None,
+        "public_repos": 8,
+        "public_gists": 8,
+        "followers": 9000,
+        "following": 9,
+        "created_at": "2011-01-25T18:44:36Z",
+        "updated_at": "2024-01-22T12:13:28Z",
+    }
+
+
+def github_repos_payload(username: str, count: int = 8) -> list[dict]:
+    """GitHub-shaped repository list."""
+    languages = ["Ruby", "JavaScript", "Python", "TypeScript", "Go", "Shell", "CSS", "HTML"]
+    return [
+        {
+            "id": 1296269 + i,
+            "name": f"repo-{i}",
+            "full_name": f"{username}/repo-{i}",
+            "html_url": f"https://github.com/{username}/repo-{i}",
+            "description": f"Sample repository {i} for {username}",
+            "fork": False,
+            "language": languages[i % len(languages)],
+            "topics": ["octocat", languages[i % len(languages)].lower()],
+            "stargazers_count": 100 * (count - i),
+            "watchers_count": 100 * (count - i),
+            "forks_count": 10 * (count - i),
+            "open_issues_count": i,
+            "size": 1024 * (i + 1),
+            "default_branch": "main",
+            "license": {"key": "mit", "name": "MIT License"},
+            "created_at": "2011-01-26T19:01:12Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "pushed_at": "2024-01-01T00:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def linkedin_profile_payload(url: str) -> dict:
+    """BrightData LinkedIn profile record."""
+    slug = url.rstrip("/").rsplit("/", 1)[-1]
+    return {
+        "id": slug,
+        "name": "Test Profile",
+        "city": "Copenhagen, Capital Region of Denmark, Denmark",
+        "country_code": "DK",
+        "position": "Senior Software Engineer at Example ApS",
+        "about": "Backend engineer focused on distributed systems and developer tooling.",
+        "current_company": {"name": "Example ApS", "link": "https://www.linkedin.com/company/example"},
+        "experience": [
+            {"title": "Senior Software Engineer", "company": "Example ApS", "start_date": "Jan 2021", "end_date": "Present"},
+            {"title": "Software Engineer", "company": "Sample A/S", "start_date": "Aug 2017", "end_date": "Dec 2020"},
+        ],
+        "education": [{"title": "Technical University of Denmark", "degree": "MSc", "field": "Computer Science"}],
+        "followers": 812,
+        "connections": 500,
+        "url": url,
+        "input_url": url,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+# ============================================================
+# SERVER STATE
+# ============================================================
+
+@dataclass
+class ScrapeJob:
+    """A simulated BrightData snapshot."""
+    snapshot_id: str
+    url: str
+    ready_at: float
+
+
+@dataclass
+class RateWindow:
+    """Fixed-window request counter for one upstream."""
+    started_at: float = 0.0
+    used: int = 0
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threading HTTP server carrying the stand-in's config and shared state."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: Optional[StandInConfig] = None):
+        super().__init__(address, StandInHandler)
+        self.config = config or StandInConfig()
+        self.profile = LATENCY_PROFILES[self.config.profile]
+        self.rng = random.Random(self.config.seed)
+        self.jobs: dict[str, ScrapeJob] = {}
+        self.rate_windows: dict[str, RateWindow] = {}
+        self.cache: dict[str, tuple[float, Any]] = {}
+        self.lock = threading.Lock()
+
+    def sample_latency_ms(self, upstream: str) -> float:
+        with self.lock:
+            return getattr(self.profile, upstream).sample(self.rng)
+
+    def pick_injected_error(self) -> Optional[int]:
+        if self.config.error_rate <= 0:
+            return None
+        with self.lock:
+            if self.rng.random() >= self.config.error_rate:
+                return None
+            return self.rng.choice(self.config.error_statuses)
+
+    def consume_rate_limit(self, upstream: str) -> tuple[bool, dict]:
+        """Count a request against the upstream's window; return (allowed, headers)."""
+        limit = self.config.rate_limit
+        if not limit:
+            return True, {}
+        now = time.time()
+        with self.lock:
+            window = self.rate_windows.setdefault(upstream, RateWindow(started_at=now))
+            if now - window.started_at >= self.config.rate_limit_window_s:
+                window.started_at, window.used = now, 0
+            allowed = window.used < limit
+            if allowed:
+                window.used += 1
+            reset_at = window.started_at + self.config.rate_limit_window_s
+            used = window.used
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(max(0, limit - used)),
+            "X-RateLimit-Used": str(used),
+            "X-RateLimit-Reset": str(int(math.ceil(reset_at))),
+            "X-RateLimit-Resource": "core" if upstream == "github" else upstream,
+        }
+        if not allowed:
+            headers["Retry-After"] = str(max(1, int(math.ceil(reset_at - now))))
+        return allowed, headers
+
+    def cache_get(self, key: str) -> Optional[tuple[Any, int]]:
+        """Fresh cached payload and its age in seconds, if any."""
+        if self.config.cache_ttl_s <= 0:
+            return None
+        with self.lock:
+            entry = self.cache.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        age = time.monotonic() - stored_at
+        if age >= self.config.cache_ttl_s:
+            return None
+        return payload, int(age)
+
+    def cache_put(self, key: str, payload: Any) -> None:
+        if self.config.cache_ttl_s > 0:
+            with self.lock:
+                self.cache[key] = (time.monotonic(), payload)
+
+    def create_job(self, url: str) -> ScrapeJob:
+        with self.lock:
+            low, high = self.profile.job_seconds
+            job = ScrapeJob(
+                snapshot_id=f"s_{uuid.uuid4().hex[:16]}",
+                url=url,
+                ready_at=time.monotonic() + self.rng.uniform(low, high),
+            )
+            self.jobs[job.snapshot_id] = job
+        return job
+
+    @staticmethod
+    def memory_usage() -> dict:
+        """Resident set size in the same shape as Node's process.memoryUsage(), where available."""
+        try:
+            with open("/proc/self/statm") as f:
+                return {"rss": int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")}
+        except (OSError, ValueError, IndexError):
+            return {}
+
+
+# ============================================================
+# REQUEST HANDLER
+# ============================================================
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves RecruitOS /api/* routes and mock GitHub/BrightData upstream routes."""
+
+    server: StandInServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs
+    # add ~40ms to every keep-alive response and swamp the numbers under test
+    disable_nagle_algorithm = True
+    server_version = "RecruitOSStandIn/1.0"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep load runs quiet; per-request logging dominates at high RPS
+        pass
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[dict] = None) -> None:
+        serialize_start = time.perf_counter()
+        body = json.dumps(payload).encode()
+        # Compress like the Next.js server does; brotli is not in the stdlib
+        gzipped = len(body) >= 1024 and "gzip" in (self.headers.get("Accept-Encoding") or "")
+        if gzipped:
+            body = gzip.compress(body, compresslevel=6)
+        if self.path.startswith("/api/"):
+            # Break down /api/* time the way an instrumented route would
+            self.phases["serialize"] = (time.perf_counter() - serialize_start) * 1000
+            timing = ", ".join(f"{name};dur={ms:.2f}" for name, ms in self.phases.items())
+            headers = {
+                **(headers or {}),
+                "Server-Timing": timing,
+                "X-Response-Time": f"{(time.perf_counter() - self.started) * 1000:.2f}ms",
+            }
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _send_cached(self, key: str, build: Any, upstream: Optional[str]) -> None:
+        """Serve a cacheable /api/* response, simulating the upstream only on a miss.
+
+        ``build`` produces the payload; cache status is reported through
+        X-Cache, Age and Cache-Control the way a CDN in front of the app would.
+        """
+        ttl = self.server.config.cache_ttl_s
+        cached = self.server.cache_get(key)
+        if cached is not None:
+            payload, age = cached
+            return self._send_json(200, payload, {
+                "X-Cache": "HIT",
+                "Age": str(age),
+                "Cache-Control": f"public, s-maxage={int(ttl)}",
+            })
+        headers: Optional[dict] = {}
+        if upstream:
+            headers = self._simulate_upstream(upstream, native=False)
+            if headers is None:
+                return
+        payload = build()
+        self.server.cache_put(key, payload)
+        if ttl > 0:
+            headers = {**headers, "X-Cache": "MISS", "Cache-Control": f"public, s-maxage={int(ttl)}"}
+        return self._send_json(200, payload, headers)
+
+    def _simulate_upstream(self, upstream: str, native: bool) -> Optional[dict]:
+        """Apply rate limiting, latency and error injection for one upstream call.
+
+        Returns headers to attach to the success response, or None if an error
+        response has already been sent. Native upstream routes answer limits the
+        way the real service does (GitHub 403, BrightData 429); /api/* routes
+        answer 429 with the upstream's rate-limit headers passed through.
+        """
+        allowed, headers = self.server.consume_rate_limit(upstream)
+        if not allowed:
+            if native and upstream == "github":
+                self._send_json(403, {"message": "API rate limit exceeded"}, headers)
+            else:
+                self._send_json(429, {"error": f"{upstream} rate limit exceeded"}, headers)
+            return None
+
+        delay_ms = self.server.sample_latency_ms(upstream)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        self.phases[upstream] = self.phases.get(upstream, 0.0) + delay_ms
+
+        status = self.server.pick_injected_error()
+        if status is not None:
+            self._send_json(status, {"error": f"Injected {upstream} failure", "code": "STAND_IN_INJECTED"}, headers)
+            return None
+        return headers
+
+    def _route(self, method: str) -> None:
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        body = self._read_body() if method == "POST" else None
+        parts = [p for p in parsed.path.split("/") if p]
+
+        # RecruitOS routes
+        if parsed.path == "/api/health":
+            return self._send_json(
+                200,
+                {"status": "ok", "database": True, "version": "stand-in", "memory": self.server.memory_usage()},
+            )
+        if parsed.path == "/api/brightdata":
+            return self._brightdata(method, query, body)
+        if parts[:2] == ["api", "brightdata"] and len(parts) == 3 and method == "POST":
+            return self._brightdata_job(parts[2], body or {})
+        if parsed.path == "/api/github" and method == "GET":
+            return self._github(query)
+
+        # Mock upstreams
+        if parts[:1] == ["users"] and method == "GET":
+            return self._upstream_github(parts[1:], query)
+        if parts[:2] == ["datasets", "v3"]:
+            return self._upstream_brightdata(method, parts[2:], body)
+        return self._send_json(404, {"error": f"Not found: {parsed.path}"})
+
+    # ---------------- RecruitOS stand-in routes ----------------
+
+    def _brightdata(self, method: str, query: dict, body: Any) -> None:
+        action = query.get("action")
+        if method == "POST" and action == "trigger":
+            url = query.get("url")
+            if not url:
+                return self._send_json(400, {"error": "LinkedIn URL is required", "code": "MISSING_URL"})
+            if "linkedin.com/in/" not in url:
+                return self._send_json(400, {"error": "Only LinkedIn profile URLs are supported", "code": "INVALID_URL"})
+            if not self.headers.get("X-BrightData-Key"):
+                return self._send_json(401, {"error": "BrightData API key is required", "code": "UNAUTHORIZED"})
+            headers = self._simulate_upstream("brightdata", native=False)
+            if headers is None:
+                return
+            job = self.server.create_job(url)
+            return self._send_json(200, {"snapshot_id": job.snapshot_id}, headers)
+        if method == "POST" and action == "scrape":
+            url = (body or {}).get("url", "")
+            return self._send_cached(
+                f"scrape:{url}",
+                lambda: {"content": f"<html><title>{url}</title><body>Example Domain</body></html>"},
+                upstream=None,
+            )
+        return self._send_json(400, {"error": f"Unknown action: {action}"})
+
+    def _brightdata_job(self, step: str, body: dict) -> None:
+        """Mirror app/api/brightdata/{trigger,progress,snapshot}."""
+        # requireAuth() runs before anything else in these routes
+        if "next-auth.session-token=" not in (self.headers.get("Cookie") or ""):
+            return self._send_json(401, {"error": "Unauthorized"})
+        if not (body.get("apiKey") or self.headers.get("X-BrightData-Key")):
+            return self._send_json(400, {"message": "BrightData API key is required"})
+        if step == "trigger":
+            if not body.get("url"):
+                return self._send_json(400, {"message": "LinkedIn URL is required"})
+            headers = self._simulate_upstream("brightdata", native=False)
+            if headers is None:
+                return
+            job = self.server.create_job(body["url"])
+            return self._send_json(200, {"snapshot_id": job.snapshot_id}, headers)
+        if step not in ("progress", "snapshot"):
+            return self._send_json(404, {"error": f"Not found: /api/brightdata/{step}"})
+        if not body.get("snapshotId"):
+            return self._send_json(400, {"message": "Snapshot ID is required"})
+        job = self.server.jobs.get(body["snapshotId"])
+        if job is None:
+            return self._send_json(404, {"message": "BrightData API error: 404"})
+        headers = self._simulate_upstream("brightdata", native=False)
+        if headers is None:
+            return
+        ready = time.monotonic() >= job.ready_at
+        if step == "progress":
+            return self._send_json(200, self._progress_payload(job, ready), headers)
+        if not ready:
+            return self._send_json(202, {"status": "running", "message": "Snapshot is not ready yet, try again later"}, headers)
+        return self._send_json(200, {"data": [linkedin_profile_payload(job.url)], "status": "ready"}, headers)
+
+    def _github(self, query: dict) -> None:
+        action = query.get("action")
+        username = query.get("username")
+        if not username:
+            return self._send_json(400, {"error": "username is required"})
+        if action not in ("user", "repos", "full"):
+            return self._send_json(400, {"error": f"Unknown action: {action}"})
+        return self._send_cached(f"github:{action}:{username}", lambda: self._github_payload(action, username), "github")
+
+    @staticmethod
+    def _github_payload(action: str, username: str) -> dict:
+        if action == "user":
+            return {"data": github_user_payload(username)}
+        repos = github_repos_payload(username)
+        if action == "repos":
+            return {"data": {"repos": repos, "total": len(repos)}}
+        languages: dict[str, int] = {}
+        for repo in repos:
+            languages[repo["language"]] = languages.get(repo["language"], 0) + 1
+        return {
+            "data": {
+                "user": github_user_payload(username),
+                "repos": repos,
+                "languages": languages,
+                "qualityScore": 87,
+            }
+        }
+
+    # ---------------- Mock upstream routes ----------------
+
+    def _upstream_github(self, parts: list[str], query: dict) -> None:
+        if len(parts) not in (1, 2) or (len(parts) == 2 and parts[1] != "repos"):
+            return self._send_json(404, {"message": "Not Found"})
+        headers = self._simulate_upstream("github", native=True)
+        if headers is None:
+            return
+        username = parts[0]
+        if len(parts) == 1:
+            return self._send_json(200, github_user_payload(username), headers)
+        per_page = min(100, int(query.get("per_page", 30)))
+        return self._send_json(200, github_repos_payload(username, min(per_page, 8)), headers)
+
+    def _upstream_brightdata(self, method: str, parts: list[str], body: Any) -> None:
+        if not (self.headers.get("Authorization") or "").startswith("Bearer "):
+            return self._send_json(401, {"error": "Unauthorized"})
+        if method == "POST" and parts == ["trigger"]:
+            inputs = body if isinstance(body, list) else []
+            if not inputs or not inputs[0].get("url"):
+                return self._send_json(400, {"error": "Input must be a non-empty array of {url}"})
+            headers = self._simulate_upstream("brightdata", native=True)
+            if headers is None:
+                return
+            job = self.server.create_job(inputs[0]["url"])
+            return self._send_json(200, {"snapshot_id": job.snapshot_id}, headers)
+        if method != "GET" or len(parts) != 2 or parts[0] not in ("progress", "snapshot"):
+            return self._send_json(404, {"error": "Not found"})
+        job = self.server.jobs.get(parts[1])
+        if job is None:
+            return self._send_json(404, {"error": "Snapshot not found"})
+        headers = self._simulate_upstream("brightdata", native=True)
+        if headers is None:
+            return
+        ready = time.monotonic() >= job.ready_at
+        if parts[0] == "progress":
+            return self._send_json(200, self._progress_payload(job, ready), headers)
+        if not ready:
+            return self._send_json(202, {"status": "running", "message": "Snapshot is not ready yet, try again in 10s"}, headers)
+        return self._send_json(200, [linkedin_profile_payload(job.url)], headers)
+
+    @staticmethod
+    def _progress_payload(job: ScrapeJob, ready: bool) -> dict:
+        return {
+            "snapshot_id": job.snapshot_id,
+            "dataset_id": BRIGHTDATA_DATASET_ID,
+            "status": "ready" if ready else "running",
+            "records": 1 if ready else 0,
+            "errors": 0,
+        }
+
+    def do_GET(self) -> None:
+        self._route("GET")
+
+    def do_POST(self) -> None:
+        self._route("POST")
+
+
+# ============================================================
+# SERVER LIFECYCLE
+# ============================================================
+
+def start_stand_in(
+    host: str = "127.0.0.1", port: int = 0, config: Optional[StandInConfig] = None,
+) -> tuple[StandInServer, str]:
+    """Start the stand-in on a daemon thread and return (server, base_url)."""
+    server = StandInServer((host, port), config)
+    thread = threading.Thread(target=server.serve_forever, name="stand-in", daemon=True)
+    thread.start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="RecruitOS stand-in backend",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=3000, help="Bind port (default: 3000)")
+    parser.add_argument(
+        "--profile",
+        choices=list(LATENCY_PROFILES),
+        default="none",
+        help="Upstream latency profile (default: none)",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of upstream calls that fail (default: 0)",
+    )
+    parser.add_argument(
+        "--error-status",
+        default="500,502,503",
+        help="Comma-separated statuses used for injected failures (default: 500,502,503)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=0,
+        help="Requests per window per upstream before limiting (default: unlimited)",
+    )
+    parser.add_argument(
+        "--rate-limit-window",
+        type=float,
+        default=60.0,
+        help="Rate-limit window in seconds (default: 60)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0.0,
+        help="Cache /api/github and scrape responses for this many seconds (default: off)",
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible latency and errors")
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        profile=args.profile,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(s) for s in args.error_status.split(",") if s.strip()),
+        rate_limit=args.rate_limit,
+        rate_limit_window_s=args.rate_limit_window,
+        cache_ttl_s=args.cache_ttl,
+        seed=args.seed,
+    )
+    server = StandInServer((args.host, args.port), config)
+    print(f"🧩 RecruitOS stand-in listening on http://{args.host}:{args.port} (profile: {config.profile})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Unit tests for the statistics behind api_tester's regression gates.
+
+Run with: python -m pytest scripts/test_api_tester.py
+"""
+
+import pytest
+
+import api_tester as at
+
+
+def make_suite(samples: dict[str, list[float]]) -> at.TestSuite:
+    return at.TestSuite(
+        name="Full Tests",
+        results=[
+            at.TestResult(name, True, at.statistics.median(values), 200, details={"samples_ms": values})
+            for name, values in samples.items()
+        ],
+    )
+
+
+def make_history(runs: list[dict[str, list[float]]], env: str = "test", base_url: str = "http://x") -> list[dict]:
+    return [
+        {
+            "env": env,
+            "base_url": base_url,
+            "tests": {name: {"passed": True, "samples_ms": values} for name, values in run.items()},
+        }
+        for run in runs
+    ]
+
+
+# ============================================================
+# MANN-WHITNEY U
+# ============================================================
+
+def test_mann_whitney_separated_samples():
+    # U = 9 of 9; normal approximation with continuity correction
+    assert at.mann_whitney_greater([4, 5, 6], [1, 2, 3]) == pytest.approx(0.0404, abs=1e-4)
+
+
+def test_mann_whitney_faster_current_is_not_significant():
+    assert at.mann_whitney_greater([1, 2, 3], [4, 5, 6]) > 0.95
+
+
+def test_mann_whitney_ties():
+    p = at.mann_whitney_greater([2, 3, 3, 4], [1, 2, 2, 3])
+    assert 0.05 < p < 0.2
+
+
+def test_mann_whitney_all_equal():
+    assert at.mann_whitney_greater([5, 5, 5], [5, 5, 5]) == 1.0
+
+
+def test_mann_whitney_too_few_samples():
+    assert at.mann_whitney_greater([1, 2], [3, 4, 5]) is None
+    assert at.mann_whitney_greater([1, 2, 3], [4, 5]) is None
+
+
+# ============================================================
+# WILCOXON SIGNED-RANK
+# ============================================================
+
+def test_wilcoxon_all_positive():
+    # W+ = 15 of 15; exact one-sided p is 1/32
+    assert at.wilcoxon_signed_rank_greater([1, 2, 3, 4, 5]) == pytest.approx(0.0295, abs=1e-4)
+
+
+def test_wilcoxon_all_negative_is_not_significant():
+    assert at.wilcoxon_signed_rank_greater([-1, -2, -3, -4, -5]) > 0.95
+
+
+def test_wilcoxon_drops_zeros_and_handles_ties():
+    # n = 6 after dropping zeros; W+ = 2 + 2 + 4.5 + 4.5 + 6 = 19
+    p = at.wilcoxon_signed_rank_greater([0, 0, 1, 1, -1, 2, 2, 3])
+    assert p == pytest.approx(0.0445, abs=1e-4)
+
+
+def test_wilcoxon_no_differences():
+    assert at.wilcoxon_signed_rank_greater([0.0] * 10) == 1.0
+
+
+def test_wilcoxon_too_few_pairs():
+    assert at.wilcoxon_signed_rank_greater([1, 2, 3, 4]) is None
+
+
+# ============================================================
+# HOLM CORRECTION
+# ============================================================
+
+def test_holm_adjust():
+    adjusted = at.holm_adjust([0.01, 0.04, 0.03, None])
+    assert adjusted[0] == pytest.approx(0.03)
+    assert adjusted[1] == pytest.approx(0.06)
+    assert adjusted[2] == pytest.approx(0.06)
+    assert adjusted[3] is None
+
+
+def test_holm_adjust_caps_at_one():
+    assert at.holm_adjust([0.5, 0.9]) == [1.0, 1.0]
+
+
+# ============================================================
+# BASELINE COMPARISON
+# ============================================================
+
+BASELINE_RUNS = [
+    {"Health Check": [10.0, 10.5, 11.0], "GitHub User": [100.0, 105.0, 110.0]},
+    {"Health Check": [9.5, 10.0, 10.5], "GitHub User": [98.0, 102.0, 104.0]},
+    {"Health Check": [10.2, 10.4, 10.6], "GitHub User": [101.0, 103.0, 108.0]},
+    {"Health Check": [9.8, 10.1, 10.3], "GitHub User": [99.0, 100.0, 106.0]},
+    {"Health Check": [10.0, 10.2, 10.9], "GitHub User": [97.0, 101.0, 103.0]},
+]
+
+
+def test_baseline_uses_per_run_medians():
+    suite = make_suite({"Health Check": [10.0] * 10})
+    [c] = at.compare_to_baseline(suite, make_history(BASELINE_RUNS), "test", "http://x")
+    assert c.baseline_ms == [10.5, 10.0, 10.4, 10.1, 10.2]
+    assert c.baseline_median == 10.2
+
+
+def test_baseline_clear_regression():
+    suite = make_suite({"Health Check": [30.0 + i for i in range(10)], "GitHub User": [102.0] * 10})
+    comparisons = at.compare_to_baseline(suite, make_history(BASELINE_RUNS), "test", "http://x")
+    by_name = {c.name: c for c in comparisons}
+    assert by_name["Health Check"].regressed
+    assert by_name["Health Check"].p_adjusted < 0.05
+    assert not by_name["GitHub User"].regressed
+
+
+def test_baseline_small_absolute_slowdown_passes():
+    # Significant and +18%, but only 1.8ms slower
+    suite = make_suite({"Health Check": [12.0 + i / 100 for i in range(10)]})
+    [c] = at.compare_to_baseline(suite, make_history(BASELINE_RUNS), "test", "http://x")
+    assert c.p_adjusted < 0.05
+    assert c.change_pct > 10
+    assert not c.regressed
+    [c] = at.compare_to_baseline(suite, make_history(BASELINE_RUNS), "test", "http://x", min_ms=1.0)
+    assert c.regressed
+
+
+def test_baseline_holm_correction_across_tests():
+    # On its own p = 0.038 fails the gate; with eight other tests it does not
+    current = [120.0, 95.0, 99.0, 125.0, 130.0, 118.0, 122.0, 128.0, 119.0, 121.0]
+    names = [f"Test {n}" for n in range(9)]
+    runs = [{name: values["GitHub User"] for name in names} for values in BASELINE_RUNS]
+    alone = at.compare_to_baseline(make_suite({"Test 0": current}), make_history(runs), "test", "http://x")
+    assert alone[0].p_value < 0.05
+    assert alone[0].regressed
+    suite = make_suite({name: current if name == "Test 0" else [102.0] * 10 for name in names})
+    comparisons = at.compare_to_baseline(suite, make_history(runs), "test", "http://x")
+    assert comparisons[0].p_value == pytest.approx(alone[0].p_value)
+    assert not comparisons[0].regressed
+
+
+def test_baseline_only_matching_recent_runs():
+    history = (
+        make_history([{"Health Check": [500.0]}] * 3)
+        + make_history([{"Health Check": [1.0]}] * 3, env="staging")
+        + make_history(BASELINE_RUNS)
+    )
+    suite = make_suite({"Health Check": [10.0] * 10})
+    [c] = at.compare_to_baseline(suite, history, "test", "http://x", runs=5)
+    assert c.baseline_ms == [10.5, 10.0, 10.4, 10.1, 10.2]
+
+
+def test_baseline_too_few_runs_is_not_tested():
+    suite = make_suite({"Health Check": [50.0] * 10})
+    [c] = at.compare_to_baseline(suite, make_history(BASELINE_RUNS[:2]), "test", "http://x")
+    assert c.p_value is None
+    assert not c.regressed
+
+
+# ============================================================
+# TARGET COMPARISON
+# ============================================================
+
+def make_targets(reference: dict[str, list[float]], target: dict[str, list[float]]) -> dict[str, at.TestSuite]:
+    return {"before": make_suite(reference), "after": make_suite(target)}
+
+
+def test_compare_targets_paired_shift():
+    # Both targets share the same per-iteration noise; "after" is 20ms slower every time
+    noise = [100.0, 140.0, 90.0, 160.0, 110.0, 95.0, 150.0, 120.0, 105.0, 130.0]
+    suites = make_targets({"GitHub User": noise}, {"GitHub User": [n + 20 for n in noise]})
+    [c] = at.compare_targets(suites, threshold_pct=10.0, alpha=0.05)
+    assert c.target == "after"
+    assert c.p_slower < 0.05
+    assert c.regressed
+
+
+def test_compare_targets_identical_deploys():
+    noise = [100.0, 140.0, 90.0, 160.0, 110.0, 95.0, 150.0, 120.0]
+    jitter = [1.0, -1.5, 0.5, 2.0, -0.5, 1.5, -2.0, 0.0]
+    suites = make_targets({"GitHub User": noise}, {"GitHub User": [n + j for n, j in zip(noise, jitter)]})
+    [c] = at.compare_targets(suites, threshold_pct=10.0, alpha=0.05)
+    assert not c.regressed
+    assert at.comparison_verdict(c) == "≈ same"
+
+
+def test_compare_targets_absolute_floor_and_holm():
+    reference = {f"Test {n}": [1.0, 1.1, 0.9, 1.2, 1.0, 1.1, 0.9, 1.0] for n in range(9)}
+    target = {name: [v + 0.5 for v in values] for name, values in reference.items()}
+    comparisons = at.compare_targets(make_targets(reference, target), threshold_pct=10.0, alpha=0.05)
+    # 50% slower everywhere and still significant after correction, but only 0.5ms
+    assert all(c.p_slower < 0.05 for c in comparisons)
+    assert not any(c.regressed for c in comparisons)
+    assert at.comparison_verdict(comparisons[0]) == "▲ slower (under threshold)"
+
+
+def test_compare_targets_pairs_only_completed_iterations():
+    suites = make_targets({"Health Check": [10.0, 11.0, 12.0]}, {"Health Check": [30.0, 31.0, 32.0, 33.0, 34.0]})
+    [c] = at.compare_targets(suites, threshold_pct=10.0, alpha=0.05)
+    assert c.p_slower is None
+    assert not c.regressed